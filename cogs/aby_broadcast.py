@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
 import random
 import time
@@ -14,29 +15,54 @@ from yume_send import send_ctx, send_channel
 from yume_store import (
     ABY_DEFAULT_DEBT,
     apply_guild_interest_upto_today,
+    bulk_incident_tick_state,
     debt_pressure_stage,
     ensure_aby_incident_state,
     update_aby_incident_state,
     apply_guild_incident,
     get_config,
     set_config,
-    get_guild_debt,
     list_aby_debt_guild_ids,
     list_recent_aby_incidents,
     week_key_from_ymd,
     week_ymds_from_week_key,
-    get_weekly_debt_summary,
-    top_repay_users_for_week,
-    get_weekly_points_ranking,
+    with_transaction,
+    get_weekly_report_bundle,
 )
 
 logger = logging.getLogger(__name__)
 
 KST = datetime.timezone(datetime.timedelta(hours=9))
 
+# Process-local RNG for incident rolls; reseed with _RNG.seed(...) for repeatable runs.
+_RNG = random.Random()
+_randint = _RNG.randint
+_choice = _RNG.choice
+_choices = _RNG.choices
+
 CFG_NOTICE_CH = "aby_notice_channel_id:{gid}"
 CFG_WEEKLY_LAST_SENT = "aby_weekly_report_last_sent_week:{gid}"
 
+_NOTICE_KEY_PREFIX = CFG_NOTICE_CH.split("{", 1)[0]
+
+# Per-guild config keys, built once instead of re-running str.format per tick.
+_NOTICE_KEY_CACHE: Dict[int, str] = {}
+_WEEKLY_KEY_CACHE: Dict[int, str] = {}
+
+
+def _notice_key(gid: int) -> str:
+    key = _NOTICE_KEY_CACHE.get(gid)
+    if key is None:
+        key = _NOTICE_KEY_CACHE[gid] = CFG_NOTICE_CH.format(gid=gid)
+    return key
+
+
+def _weekly_key(gid: int) -> str:
+    key = _WEEKLY_KEY_CACHE.get(gid)
+    if key is None:
+        key = _WEEKLY_KEY_CACHE[gid] = CFG_WEEKLY_LAST_SENT.format(gid=gid)
+    return key
+
 
 def _now_kst() -> datetime.datetime:
     return datetime.datetime.now(tz=KST)
@@ -47,12 +73,37 @@ def _today_ymd_kst() -> str:
 
 
 def _fmt(n: int) -> str:
+    if type(n) is int:
+        return format(n, ",")
     try:
-        return f"{int(n):,}"
+        return format(int(n), ",")
     except Exception:
         return str(n)
 
 
+# debt_pressure_stage() reports a narrative label; the incident tables below
+# want a numeric level, so map each label to its rung on the ladder.
+_PRESSURE_LEVELS: Dict[str, int] = {"버티는 중": 0, "긴장": 2, "위기": 4, "절망": 6, "종말": 8}
+_STAGE_BUCKET = 10_000
+
+
+@functools.lru_cache(maxsize=1024)
+def _stage_cached(bucket: int) -> Tuple[int, str]:
+    st = debt_pressure_stage(bucket * _STAGE_BUCKET)
+    label = str(st.get("stage") or "")
+    return _PRESSURE_LEVELS.get(label, 0), f"{st.get('emoji') or ''} {label}".strip()
+
+
+def _pressure(debt: int) -> Tuple[int, str]:
+    """Return (level, label) for a debt, memoized per 10k-credit bucket."""
+    return _stage_cached(max(0, int(debt)) // _STAGE_BUCKET)
+
+
+def _fmt_kst_short(ts: int) -> str:
+    """`MM/DD HH:MM` in KST without building a datetime."""
+    return time.strftime("%m/%d %H:%M", time.gmtime(ts + 9 * 3600))
+
+
 def _parse_channel_mention(ctx: commands.Context) -> Optional[int]:
     try:
         if ctx.message.channel_mentions:
@@ -62,9 +113,8 @@ def _parse_channel_mention(ctx: commands.Context) -> Optional[int]:
     return None
 
 
-def _get_notice_channel_id(guild_id: int) -> Optional[int]:
+def _parse_notice_channel_id(raw: Any) -> Optional[int]:
     try:
-        raw = get_config(CFG_NOTICE_CH.format(gid=int(guild_id)), "")
         if not raw:
             return None
         v = int(str(raw).strip())
@@ -73,8 +123,15 @@ def _get_notice_channel_id(guild_id: int) -> Optional[int]:
         return None
 
 
+def _get_notice_channel_id(guild_id: int) -> Optional[int]:
+    try:
+        return _parse_notice_channel_id(get_config(_notice_key(int(guild_id)), ""))
+    except Exception:
+        return None
+
+
 def _set_notice_channel_id(guild_id: int, channel_id: Optional[int]) -> None:
-    key = CFG_NOTICE_CH.format(gid=int(guild_id))
+    key = _notice_key(int(guild_id))
     if not channel_id:
         set_config(key, "")
     else:
@@ -102,54 +159,58 @@ def _week_range_text(week_key: str) -> str:
     return f"{ymds[0]} ~ {ymds[-1]}"
 
 
+_GOOD_CHOICES: Tuple[Tuple[str, str, Tuple[int, int]], ...] = (
+    ("익명 후원", "정체불명의 후원금이 들어왔어. 누가… 우리를 아직 포기 안 했나 봐.", (-250_000, -50_000)),
+    ("중고 부품 매각", "쓸만한 고철을 정리해서 팔았어. 아주 조금 숨통이 트였어.", (-180_000, -30_000)),
+    ("미세한 우호", "오늘은 추심 연락이 없었어. 이상하게 조용해… 더 무섭지?", (-80_000, -10_000)),
+)
+
+_BAD_CHOICES: Tuple[Tuple[str, str, float], ...] = (
+    ("추심 연락", "시끌벅적한 통화가 이어졌어. '오늘 중으로…' 라는 말이 너무 익숙해.", 1.00),
+    ("장비 파손", "탐사 장비 일부가 망가졌어. 수리비… 또 돈이야.", 1.10),
+    ("서류 누락", "납품 서류가 하나 사라졌대. 벌금이 붙었어. 으헤~…", 0.85),
+    ("연체 수수료", "작은 연체가 누적됐대. 작은데… 계속 쌓여.", 0.95),
+    ("물가 폭등", "필터랑 배터리 가격이 올랐어. 유지비가 늘었어.", 0.90),
+)
+
+_OUTCOMES = ("good", "bad")
+
+# How often incident_loop re-reads the schedule from the DB (new guilds etc).
+_NEXT_FIRE_RESEED_SEC = 30 * 60
+
+# Next-incident window (seconds), indexed by min(stage, 6) // 2.
+_STAGE_RANGES: Tuple[Tuple[int, int], ...] = (
+    (4 * 60 * 60, 10 * 60 * 60),
+    (2 * 60 * 60, 6 * 60 * 60),
+    (90 * 60, 4 * 60 * 60),
+    (60 * 60, 3 * 60 * 60),
+)
+
+
 def _roll_incident(debt: int) -> Dict[str, Any]:
     """Return an incident dict: {title, desc, delta_debt}."""
-    d = int(debt)
-    stage = int(debt_pressure_stage(d).get("stage") or 0)
+    stage, _ = _pressure(debt)
 
     # As pressure rises, bad incidents become more likely.
     bad_weight = min(0.85, 0.45 + stage * 0.08)
-    good_weight = 1.0 - bad_weight
 
-    if random.random() < good_weight:
-        choices: list[Tuple[str, str, Tuple[int, int]]] = [
-            ("익명 후원", "정체불명의 후원금이 들어왔어. 누가… 우리를 아직 포기 안 했나 봐.", (-250_000, -50_000)),
-            ("중고 부품 매각", "쓸만한 고철을 정리해서 팔았어. 아주 조금 숨통이 트였어.", (-180_000, -30_000)),
-            ("미세한 우호", "오늘은 추심 연락이 없었어. 이상하게 조용해… 더 무섭지?", (-80_000, -10_000)),
-        ]
-        title, desc, (lo, hi) = random.choice(choices)
-        return {"title": title, "desc": desc, "delta_debt": int(random.randint(lo, hi))}
+    if _choices(_OUTCOMES, weights=(1.0 - bad_weight, bad_weight))[0] == "good":
+        title, desc, (lo, hi) = _choice(_GOOD_CHOICES)
+        return {"title": title, "desc": desc, "delta_debt": int(_randint(lo, hi))}
 
     base_lo = 40_000 + stage * 40_000
     base_hi = min(1_200_000, 180_000 + stage * 120_000)
 
-    choices2: list[Tuple[str, str, float]] = [
-        ("추심 연락", "시끌벅적한 통화가 이어졌어. '오늘 중으로…' 라는 말이 너무 익숙해.", 1.00),
-        ("장비 파손", "탐사 장비 일부가 망가졌어. 수리비… 또 돈이야.", 1.10),
-        ("서류 누락", "납품 서류가 하나 사라졌대. 벌금이 붙었어. 으헤~…", 0.85),
-        ("연체 수수료", "작은 연체가 누적됐대. 작은데… 계속 쌓여.", 0.95),
-        ("물가 폭등", "필터랑 배터리 가격이 올랐어. 유지비가 늘었어.", 0.90),
-    ]
-    title, desc, mult = random.choice(choices2)
+    title, desc, mult = _choice(_BAD_CHOICES)
     lo = int(base_lo * mult)
     hi = int(base_hi * mult)
-    return {"title": title, "desc": desc, "delta_debt": int(random.randint(lo, hi))}
+    return {"title": title, "desc": desc, "delta_debt": int(_randint(lo, hi))}
 
 
 def _roll_next_incident_at(now_ts: int, debt: int) -> int:
-    d = int(debt)
-    stage = int(debt_pressure_stage(d).get("stage") or 0)
-
-    if stage >= 6:
-        lo, hi = 60 * 60, 3 * 60 * 60
-    elif stage >= 4:
-        lo, hi = 90 * 60, 4 * 60 * 60
-    elif stage >= 2:
-        lo, hi = 2 * 60 * 60, 6 * 60 * 60
-    else:
-        lo, hi = 4 * 60 * 60, 10 * 60 * 60
-
-    return int(now_ts + random.randint(lo, hi))
+    stage, _ = _pressure(debt)
+    lo, hi = _STAGE_RANGES[min(stage, 6) // 2]
+    return int(now_ts + _randint(lo, hi))
 
 
 class AbyBroadcastCog(commands.Cog):
@@ -158,20 +219,25 @@ class AbyBroadcastCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+        # gid -> next_incident_at, so idle ticks are a dict scan with no DB work.
+        # Re-seeded periodically to pick up new guilds / external edits.
+        self._next_fire_at: Dict[int, int] = {}
+        self._next_fire_reseed_at = 0
+
         if not self.incident_loop.is_running():
             self.incident_loop.start()
-        if not self.weekly_report_loop.is_running():
-            self.weekly_report_loop.start()
+
+    async def cog_load(self) -> None:
+        try:
+            self._seed_next_fire_at(int(time.time()))
+        except Exception as e:
+            logger.exception("incident schedule seed failed: %s", e)
 
     def cog_unload(self) -> None:
         try:
             self.incident_loop.cancel()
         except Exception:
             pass
-        try:
-            self.weekly_report_loop.cancel()
-        except Exception:
-            pass
 
     # ------------------------------
     # Config
@@ -244,12 +310,11 @@ class AbyBroadcastCog(commands.Cog):
 
         for r in rows:
             ts = int(r.get("created_at") or 0)
-            dt = datetime.datetime.fromtimestamp(ts, tz=KST)
             title = str(r.get("title") or "")
             desc = str(r.get("description") or "")
             delta = int(r.get("delta_debt") or 0)
             sign = "+" if delta >= 0 else ""
-            lines.append(f"- `{dt:%m/%d %H:%M}` **{title}** ({sign}{_fmt(delta)} 빚)\n  {desc}")
+            lines.append(f"- `{_fmt_kst_short(ts)}` **{title}** ({sign}{_fmt(delta)} 빚)\n  {desc}")
 
         await send_ctx(ctx, "\n".join(lines), allow_glitch=True)
 
@@ -283,85 +348,133 @@ class AbyBroadcastCog(commands.Cog):
     # Background loops
     # ------------------------------
 
-    @tasks.loop(seconds=120)
-    async def incident_loop(self):
-        if not self.bot.is_ready():
-            return
-
-        now_ts = int(time.time())
-        today = _today_ymd_kst()
+    def _seed_next_fire_at(self, now_ts: int) -> Dict[int, Dict[str, Any]]:
+        """Rebuild the in-memory schedule from one bulk read; returns the batch."""
 
-        for gid in list_aby_debt_guild_ids():
+        batch = bulk_incident_tick_state(notice_key_prefix=_NOTICE_KEY_PREFIX)
+        schedule: Dict[int, int] = {}
+        for gid, row in batch.items():
             try:
-                st = ensure_aby_incident_state(gid)
+                st = row
+                if row.get("next_incident_at") is None:
+                    st = ensure_aby_incident_state(gid)
                 nxt = int(st.get("next_incident_at") or 0)
                 if nxt <= 0:
                     nxt = now_ts + 2 * 3600
                     update_aby_incident_state(gid, next_incident_at=nxt, last_incident_at=int(st.get("last_incident_at") or 0))
-                if now_ts < nxt:
-                    continue
+                schedule[gid] = nxt
+            except Exception as e:
+                logger.exception("incident schedule seed error (gid=%s): %s", gid, e)
 
-                try:
-                    apply_guild_interest_upto_today(gid, today)
-                except Exception:
-                    pass
-
-                debt_info = get_guild_debt(gid, today_ymd=today)
-                debt = int(debt_info.get("debt") or ABY_DEFAULT_DEBT)
-
-                inc = _roll_incident(debt)
-                title = str(inc.get("title") or "사건")
-                desc = str(inc.get("desc") or "")
-                delta = int(inc.get("delta_debt") or 0)
-
-                res = apply_guild_incident(
-                    gid,
-                    title=title,
-                    description=desc,
-                    delta_debt=delta,
-                    today_ymd=today,
-                )
-                new_debt = int(res.get("new_debt") or debt)
+        self._next_fire_at = schedule
+        self._next_fire_reseed_at = now_ts + _NEXT_FIRE_RESEED_SEC
+        return batch
 
-                next_ts = _roll_next_incident_at(now_ts, new_debt)
-                update_aby_incident_state(gid, next_incident_at=next_ts, last_incident_at=now_ts)
+    @tasks.loop(seconds=120)
+    async def incident_loop(self):
+        """One tick for both jobs: due incidents, then the Monday weekly report."""
+        if not self.bot.is_ready():
+            return
 
-                ch_id = _get_notice_channel_id(gid)
-                if ch_id:
-                    ch = _get_text_channel(self.bot, gid, ch_id)
-                    if ch:
-                        stage = debt_pressure_stage(new_debt)
-                        stage_label = str(stage.get("label") or "")
-                        sign = "+" if delta >= 0 else ""
-                        msg = (
-                            f"📌 **아비도스 사건 발생**\n"
+        now_ts = int(time.time())
+        try:
+            await self._run_incidents(now_ts)
+        except Exception as e:
+            logger.exception("incident loop error: %s", e)
+
+        now = datetime.datetime.fromtimestamp(now_ts, tz=KST)
+        if (now.weekday(), now.hour) == (0, 0) and 5 <= now.minute <= 55:
+            await self._send_weekly_reports(now)
 
-                            f"**{title}** — {desc}\n"
+    async def _run_incidents(self, now_ts: int) -> None:
+        batch: Optional[Dict[int, Dict[str, Any]]] = None
+        if now_ts >= self._next_fire_reseed_at:
+            batch = self._seed_next_fire_at(now_ts)
+
+        due_ids = [gid for gid, nxt in self._next_fire_at.items() if nxt <= now_ts]
+        if not due_ids:
+            return
 
-                            f"- 빚 변화: **{sign}{_fmt(delta)}**\n"
+        # One query for debt + notice channel of every guild.
+        if batch is None:
+            batch = bulk_incident_tick_state(notice_key_prefix=_NOTICE_KEY_PREFIX)
 
-                            f"- 현재 빚: **{_fmt(new_debt)}**\n"
+        due: list[Tuple[int, Dict[str, Any]]] = []
+        for gid in due_ids:
+            row = batch.get(gid)
+            if row is None:
+                self._next_fire_at.pop(gid, None)
+                continue
+            due.append((gid, row))
+        if not due:
+            return
 
-                            f"- 압박 단계: **{stage_label}**"
+        today = _today_ymd_kst()
 
+        # All write-backs for this tick commit once; each guild is its own
+        # savepoint so one failure doesn't roll back the others.
+        notices: list[Tuple[int, int, str, str, int, int]] = []
+        rescheduled: Dict[int, int] = {}
+        with with_transaction():
+            for gid, row in due:
+                try:
+                    with with_transaction():
+                        debt = int(row.get("debt") or ABY_DEFAULT_DEBT)
+                        try:
+                            debt = int(apply_guild_interest_upto_today(gid, today).get("debt") or debt)
+                        except Exception:
+                            pass
+
+                        inc = _roll_incident(debt)
+                        title = str(inc.get("title") or "사건")
+                        desc = str(inc.get("desc") or "")
+                        delta = int(inc.get("delta_debt") or 0)
+
+                        res = apply_guild_incident(
+                            gid,
+                            title=title,
+                            description=desc,
+                            delta_debt=delta,
+                            today_ymd=today,
                         )
-                        await send_channel(ch, msg, target_user_id=None, allow_glitch=False)
+                        new_debt = int(res.get("new_debt") or debt)
 
-            except Exception as e:
-                logger.exception("incident loop error (gid=%s): %s", gid, e)
-                continue
+                        next_ts = _roll_next_incident_at(now_ts, new_debt)
+                        update_aby_incident_state(gid, next_incident_at=next_ts, last_incident_at=now_ts)
+                    rescheduled[gid] = next_ts
 
-    @tasks.loop(minutes=10)
-    async def weekly_report_loop(self):
-        if not self.bot.is_ready():
-            return
+                    ch_id = _parse_notice_channel_id(row.get("notice_channel"))
+                    if ch_id:
+                        notices.append((gid, ch_id, title, desc, delta, new_debt))
 
-        now = _now_kst()
-        if now.weekday() != 0:
-            return
-        if not (now.hour == 0 and 5 <= now.minute <= 55):
-            return
+                except Exception as e:
+                    logger.exception("incident loop error (gid=%s): %s", gid, e)
+                    continue
+
+        self._next_fire_at.update(rescheduled)
+
+        # Discord sends stay outside the transaction so network latency never holds the DB lock.
+        for gid, ch_id, title, desc, delta, new_debt in notices:
+            try:
+                ch = _get_text_channel(self.bot, gid, ch_id)
+                if not ch:
+                    continue
+                _, stage_label = _pressure(new_debt)
+                sign = "+" if delta >= 0 else ""
+                msg = "\n".join(
+                    (
+                        "📌 **아비도스 사건 발생**",
+                        f"**{title}** — {desc}",
+                        f"- 빚 변화: **{sign}{_fmt(delta)}**",
+                        f"- 현재 빚: **{_fmt(new_debt)}**",
+                        f"- 압박 단계: **{stage_label}**",
+                    )
+                )
+                await send_channel(ch, msg, target_user_id=None, allow_glitch=False)
+            except Exception as e:
+                logger.exception("incident notice error (gid=%s): %s", gid, e)
 
+    async def _send_weekly_reports(self, now: datetime.datetime) -> None:
         today = now.date().isoformat()
         prev_wk = _prev_week_key(today)
 
@@ -371,7 +484,7 @@ class AbyBroadcastCog(commands.Cog):
                 if not ch_id:
                     continue
 
-                last = get_config(CFG_WEEKLY_LAST_SENT.format(gid=gid), "")
+                last = get_config(_weekly_key(gid), "")
                 if str(last or "") == prev_wk:
                     continue
 
@@ -381,7 +494,7 @@ class AbyBroadcastCog(commands.Cog):
 
                 embed = self._build_weekly_report_embed(gid, prev_wk)
                 await send_channel(ch, "🗞️ **아비도스 주간 리포트**", embed=embed, target_user_id=None, allow_glitch=False)
-                set_config(CFG_WEEKLY_LAST_SENT.format(gid=gid), prev_wk)
+                set_config(_weekly_key(gid), prev_wk)
 
             except Exception as e:
                 logger.exception("weekly report loop error (gid=%s): %s", gid, e)
@@ -395,7 +508,8 @@ class AbyBroadcastCog(commands.Cog):
         gid = int(guild_id)
         wk = str(week_key)
 
-        summary = get_weekly_debt_summary(gid, wk)
+        b = get_weekly_report_bundle(gid, wk, today_ymd=_today_ymd_kst(), limit=5)
+        summary, debt_info, tops, pts = b["summary"], b["debt"], b["tops"], b["points"]
         interest = int(summary.get("interest_delta") or 0)
         incidents = int(summary.get("incident_delta") or 0)
         repays = int(summary.get("repay_delta") or 0)
@@ -407,10 +521,8 @@ class AbyBroadcastCog(commands.Cog):
         sign_inc = "+" if incidents >= 0 else ""
         sign_rep = "+" if repays >= 0 else ""
 
-        debt_info = get_guild_debt(gid, today_ymd=_today_ymd_kst())
         cur_debt = int(debt_info.get("debt") or ABY_DEFAULT_DEBT)
-        stage = debt_pressure_stage(cur_debt)
-        stage_label = str(stage.get("label") or "")
+        _, stage_label = _pressure(cur_debt)
 
         emb = discord.Embed(
             title=f"주간 리포트 · {wk}",
@@ -420,11 +532,13 @@ class AbyBroadcastCog(commands.Cog):
 
         emb.add_field(
             name="빚 증감(주간)",
-            value=(
-                f"- 순증감: **{sign_net}{_fmt(net)}**\n"
-                f"- 이자: {sign_int}{_fmt(interest)}\n"
-                f"- 사건: {sign_inc}{_fmt(incidents)}\n"
-                f"- 상환: {sign_rep}{_fmt(repays)}"
+            value="\n".join(
+                (
+                    f"- 순증감: **{sign_net}{_fmt(net)}**",
+                    f"- 이자: {sign_int}{_fmt(interest)}",
+                    f"- 사건: {sign_inc}{_fmt(incidents)}",
+                    f"- 상환: {sign_rep}{_fmt(repays)}",
+                )
             ),
             inline=False,
         )
@@ -435,26 +549,18 @@ class AbyBroadcastCog(commands.Cog):
             inline=False,
         )
 
-        tops = top_repay_users_for_week(gid, wk, limit=5)
         if tops:
-            lines = []
-            rank = 1
-            for r in tops:
-                uid = int(r.get("user_id") or 0)
-                total = int(r.get("total") or 0)
-                lines.append(f"{rank}. <@{uid}> — **{_fmt(total)}**")
-                rank += 1
+            lines = [
+                f"{i}. <@{int(r.get('user_id') or 0)}> — **{_fmt(int(r.get('total') or 0))}**"
+                for i, r in enumerate(tops, 1)
+            ]
             emb.add_field(name="상환 TOP", value="\n".join(lines), inline=False)
 
-        pts = get_weekly_points_ranking(gid, wk, limit=5)
         if pts:
-            lines = []
-            rank = 1
-            for r in pts:
-                uid = int(r.get("user_id") or 0)
-                p = int(r.get("points") or 0)
-                lines.append(f"{rank}. <@{uid}> — **{_fmt(p)}pt**")
-                rank += 1
+            lines = [
+                f"{i}. <@{int(r.get('user_id') or 0)}> — **{_fmt(int(r.get('points') or 0))}pt**"
+                for i, r in enumerate(pts, 1)
+            ]
             emb.add_field(name="의뢰 포인트 TOP", value="\n".join(lines), inline=False)
 
         emb.set_footer(text="(Phase7) 사건/추심 + 주간 리포트")  # tiny label for debugging
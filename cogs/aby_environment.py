@@ -1,26 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
 import random
-import re
 import time
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import discord
 from discord.ext import commands, tasks
 
-from yume_send import send_ctx
+from yume_runtime import BackgroundTasks
+from yume_send import fmt_kst, send_ctx
 from yume_store import (
     ABY_DEFAULT_DEBT,
     ABY_DEFAULT_INTEREST_RATE,
-    apply_guild_interest_upto_today,
+    apply_all_guild_interest_upto_today,
     debt_pressure_stage,
     ensure_world_weather_rotated,
     get_config,
     get_guild_debt,
     get_world_state,
-    list_aby_debt_guild_ids,
+    load_all_aby_configs,
     set_config,
     set_world_weather,
 )
@@ -34,6 +35,33 @@ OWNER_ID = 1433962010785349634
 KST = datetime.timezone(datetime.timedelta(hours=9))
 
 
+# _maintenance_loop wakes right after the next weather rotation / debt run,
+# within these bounds. Debt interest is checked every 5 minutes.
+_WAKE_MIN_SEC = 30
+_WAKE_MAX_SEC = 6 * 3600
+_DEBT_RUN_INTERVAL_SEC = 5 * 60
+
+# Per-guild bot_config keys are "<prefix><guild_id>"; joined in SQL by the store.
+_DEBT_ANNOUNCE_CHANNEL_PREFIX = "aby_debt_announce_channel_id:"
+_DEBT_ANNOUNCE_MARKER_PREFIX = "aby_debt_last_announce_ymd:"
+_ANNOUNCE_CHANNEL_TTL_SEC = 10 * 60
+_ANNOUNCE_CONCURRENCY = 10
+
+# Embeds are built in one shot via Embed.from_dict (raw int colours).
+_COLOR_GOLD = discord.Color.gold().value
+_COLOR_ORANGE = discord.Color.orange().value
+
+
+class _KeepAsciiDigits(dict):
+    """str.translate table: keep 0-9, drop every other character."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+_KEEP_DIGITS = _KeepAsciiDigits({ord(c): c for c in "0123456789"})
+
+
 WEATHER_LABEL = {
     "clear": "맑음",
     "cloudy": "흐림",
@@ -41,13 +69,6 @@ WEATHER_LABEL = {
 }
 
 
-def _fmt_kst(ts: int) -> str:
-    if not ts:
-        return "-"
-    dt = datetime.datetime.fromtimestamp(int(ts), tz=KST)
-    return dt.strftime("%m/%d %H:%M")
-
-
 def _roll_next_change_at(now: int, weather: str) -> int:
     """Phase2: 날씨별 지속 시간을 랜덤으로 굴려요."""
 
@@ -59,28 +80,40 @@ def _roll_next_change_at(now: int, weather: str) -> int:
     return int(now + random.randint(4 * 3600, 8 * 3600))
 
 
+_WEATHER_ALIASES = {
+    "맑음": "clear",
+    "clear": "clear",
+    "sun": "clear",
+    "sunny": "clear",
+    "흐림": "cloudy",
+    "cloudy": "cloudy",
+    "cloud": "cloudy",
+    "모래": "sandstorm",
+    "모래폭풍": "sandstorm",
+    "폭풍": "sandstorm",
+    "sandstorm": "sandstorm",
+    "storm": "sandstorm",
+}
+
+
 def _normalize_weather(arg: str) -> Optional[str]:
-    a = (arg or "").strip().lower()
-    if a in ("맑음", "clear", "sun", "sunny"):
-        return "clear"
-    if a in ("흐림", "cloudy", "cloud"):
-        return "cloudy"
-    if a in ("모래", "모래폭풍", "폭풍", "sandstorm", "storm"):
-        return "sandstorm"
-    return None
+    return _WEATHER_ALIASES.get((arg or "").strip().lower())
 
 
 def _today_ymd_kst() -> str:
     return datetime.datetime.now(tz=KST).date().isoformat()
 
 
+_WEATHER_ONE_LINERS = {
+    "sandstorm": "으아아… 퉤퉤! 입에 모래가 다 들어왔어… 잠깐만… 지…지지직…",
+    "cloudy": "흐음~ 하늘이 좀 흐리네. 그래도 포스터는… 붙일 수 있겠지? 에헤헤.",
+    "clear": "오늘 날씨 좋다! 포스터 붙이기 딱이야~",
+}
+
+
 def _weather_one_liner(weather: str) -> str:
     w = (weather or "clear").strip()
-    if w == "sandstorm":
-        return "으아아… 퉤퉤! 입에 모래가 다 들어왔어… 잠깐만… 지…지지직…"
-    if w == "cloudy":
-        return "흐음~ 하늘이 좀 흐리네. 그래도 포스터는… 붙일 수 있겠지? 에헤헤."
-    return "오늘 날씨 좋다! 포스터 붙이기 딱이야~"
+    return _WEATHER_ONE_LINERS.get(w) or _WEATHER_ONE_LINERS["clear"]
 
 
 class AbyEnvironmentCog(commands.Cog):
@@ -93,25 +126,52 @@ class AbyEnvironmentCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        if not self._weather_loop.is_running():
-            self._weather_loop.start()
-        if not self._debt_loop.is_running():
-            self._debt_loop.start()
-
-    def cog_unload(self) -> None:
+        # chan_id -> (monotonic ts, channel) for fetch_channel fallbacks.
+        self._announce_channels: Dict[int, Tuple[float, discord.abc.Messageable]] = {}
+        self._bg = BackgroundTasks("AbyEnvironment")
+        self._next_debt_run_at = 0
+        # Warm announce-channel / last-announce keys once; loops then hit the cache.
         try:
-            self._weather_loop.cancel()
+            load_all_aby_configs()
         except Exception:
-            pass
+            logger.exception("AbyEnvironment: config warm-up failed")
+
+    async def cog_load(self) -> None:
+        # Start the loop only once add_cog has accepted this instance; starting it in
+        # __init__ leaked a second loop whenever add_cog rejected a duplicate.
+        if not self._maintenance_loop.is_running():
+            self._maintenance_loop.start()
 
+    def cog_unload(self) -> None:
         try:
-            self._debt_loop.cancel()
+            self._maintenance_loop.cancel()
         except Exception:
             pass
 
     @tasks.loop(seconds=60)
-    async def _weather_loop(self) -> None:
-        """Background weather rotation.
+    async def _maintenance_loop(self) -> None:
+        """Single background loop for weather rotation + debt interest.
+
+        - Weather: only writes when the scheduled time has passed.
+        - Debt: every _DEBT_RUN_INTERVAL_SEC (interest itself is once per KST day).
+        - Between runs it sleeps until whichever of the two is due first.
+        """
+
+        now = int(time.time())
+        next_weather_at = await self._weather_tick(now)
+
+        if now >= self._next_debt_run_at:
+            self._next_debt_run_at = now + _DEBT_RUN_INTERVAL_SEC
+            await self._debt_tick()
+
+        self._schedule_wakeup(next_weather_at, now)
+
+    @_maintenance_loop.before_loop
+    async def _before_maintenance_loop(self) -> None:
+        await self.bot.wait_until_ready()
+
+    async def _weather_tick(self, now: int) -> int:
+        """Background weather rotation; returns the next scheduled change time.
 
         - Safe: only writes when the scheduled time has passed.
         - Does not spam by default; announcements are opt-in.
@@ -119,7 +179,6 @@ class AbyEnvironmentCog(commands.Cog):
 
         try:
             prev = get_world_state()
-            now = int(time.time())
             next_at = int(prev.get("weather_next_change_at") or 0)
             # Defensive: if next_at is absurdly far in the future (ms timestamp bug etc.),
             # force a rotate repair via ensure_world_weather_rotated.
@@ -130,34 +189,44 @@ class AbyEnvironmentCog(commands.Cog):
                 except Exception:
                     pass
                 next_at = now - 1
+                prev = {**prev, "weather_next_change_at": next_at}
 
             if next_at > 0 and now < next_at:
-                return
+                return next_at
 
             prev_weather = str(prev.get("weather") or "clear")
             prev_changed_at = int(prev.get("weather_changed_at") or 0)
 
-            new_state = ensure_world_weather_rotated(now_ts=now)
+            new_state = ensure_world_weather_rotated(now_ts=now, state=prev)
             new_weather = str(new_state.get("weather") or "clear")
             new_changed_at = int(new_state.get("weather_changed_at") or 0)
 
             # If rotated (changed_at updated), announce if configured.
+            # Sent in the background so a slow fetch_channel/send never delays the loop.
             if new_changed_at != prev_changed_at:
-                await self._maybe_announce_change(prev_weather, new_weather, new_state)
+                self._bg.spawn(self._maybe_announce_change(prev_weather, new_weather, new_state))
+
+            return int(new_state.get("weather_next_change_at") or 0)
 
         except Exception:
-            logger.exception("AbyEnvironment: weather loop failed")
+            logger.exception("AbyEnvironment: weather tick failed")
+            return now + 60
 
-    @_weather_loop.before_loop
-    async def _before_weather_loop(self) -> None:
-        await self.bot.wait_until_ready()
+    def _schedule_wakeup(self, next_weather_at: int, now: int) -> None:
+        """Sleep until the next weather rotation or debt run, whichever comes first."""
+
+        due = min(int(next_weather_at), int(self._next_debt_run_at))
+        delay = min(_WAKE_MAX_SEC, max(_WAKE_MIN_SEC, due - int(now) + 1))
+        try:
+            self._maintenance_loop.change_interval(seconds=delay)
+        except Exception:
+            logger.exception("AbyEnvironment: failed to reschedule maintenance loop")
 
     # ------------------------------
     # Phase6: Debt auto-interest + announcements
     # ------------------------------
 
-    @tasks.loop(minutes=5)
-    async def _debt_loop(self) -> None:
+    async def _debt_tick(self) -> None:
         """Background debt interest application.
 
         Safe by design:
@@ -167,48 +236,61 @@ class AbyEnvironmentCog(commands.Cog):
 
         try:
             today = _today_ymd_kst()
-            guild_ids = list_aby_debt_guild_ids()
-            if not guild_ids:
-                return
 
-            for gid in guild_ids:
-                res = apply_guild_interest_upto_today(int(gid), today)
-                applied_days = int(res.get("applied_days") or 0)
-                if applied_days <= 0:
-                    continue
-                await self._maybe_announce_debt_update(int(gid), res, today)
+            # One transaction for every guild; only guilds that actually
+            # accrued interest come back. The last-announce marker is claimed
+            # in the same transaction, so a guild is announced at most once a day.
+            results = apply_all_guild_interest_upto_today(
+                today,
+                announce_channel_prefix=_DEBT_ANNOUNCE_CHANNEL_PREFIX,
+                announce_marker_prefix=_DEBT_ANNOUNCE_MARKER_PREFIX,
+            )
+            pending = [r for r in results if int(r.get("announce_channel_id") or 0)]
+            if pending:
+                # Fan out the sends; the semaphore keeps us well under Discord's global limit.
+                sem = asyncio.Semaphore(_ANNOUNCE_CONCURRENCY)
+
+                async def _announce(res: dict) -> None:
+                    async with sem:
+                        await self._maybe_announce_debt_update(int(res["guild_id"]), res, today)
+
+                outcomes = await asyncio.gather(*(_announce(r) for r in pending), return_exceptions=True)
+                for res, outcome in zip(pending, outcomes):
+                    if isinstance(outcome, Exception):
+                        logger.warning("AbyEnvironment: debt announce failed (guild=%s): %r", res.get("guild_id"), outcome)
 
         except Exception:
-            logger.exception("AbyEnvironment: debt loop failed")
+            logger.exception("AbyEnvironment: debt tick failed")
 
-    @_debt_loop.before_loop
-    async def _before_debt_loop(self) -> None:
-        await self.bot.wait_until_ready()
+    async def _resolve_announce_channel(self, chan_id: int) -> Optional[discord.abc.Messageable]:
+        """get_channel 캐시 → (미스일 때만) fetch_channel, fetch 결과는 잠깐 기억해둔다."""
 
-    async def _maybe_announce_debt_update(self, guild_id: int, res: dict, today_ymd: str) -> None:
-        key_chan = f"aby_debt_announce_channel_id:{int(guild_id)}"
-        chan_id_s = get_config(key_chan, None)
-        if not chan_id_s:
-            return
+        ch = self.bot.get_channel(chan_id)
+        if ch is None:
+            now = time.monotonic()
+            hit = self._announce_channels.get(chan_id)
+            if hit is not None and now - hit[0] < _ANNOUNCE_CHANNEL_TTL_SEC:
+                ch = hit[1]
+            else:
+                try:
+                    ch = await self.bot.fetch_channel(chan_id)
+                except Exception:
+                    self._announce_channels.pop(chan_id, None)
+                    return None
+                self._announce_channels[chan_id] = (now, ch)
 
-        try:
-            chan_id = int(chan_id_s)
-        except Exception:
-            return
+        if not isinstance(ch, (discord.TextChannel, discord.Thread)):
+            return None
+        return ch
 
-        key_last = f"aby_debt_last_announce_ymd:{int(guild_id)}"
-        last_ymd = str(get_config(key_last, "") or "")
-        if last_ymd == str(today_ymd):
+    async def _maybe_announce_debt_update(self, guild_id: int, res: dict, today_ymd: str) -> None:
+        # _debt_tick already claimed today's announce marker for this guild.
+        chan_id = int(res.get("announce_channel_id") or 0)
+        if not chan_id:
             return
 
-        ch = self.bot.get_channel(chan_id)
+        ch = await self._resolve_announce_channel(chan_id)
         if ch is None:
-            try:
-                ch = await self.bot.fetch_channel(chan_id)
-            except Exception:
-                return
-
-        if not isinstance(ch, (discord.TextChannel, discord.Thread)):
             return
 
         s = get_guild_debt(int(guild_id))
@@ -226,27 +308,26 @@ class AbyEnvironmentCog(commands.Cog):
         if applied_days > 1:
             note = f"(봇이 꺼져있던 기간 포함: {applied_days}일치 이자 반영)"
 
-        embed = discord.Embed(
-            title="아비도스 채무 갱신",
-            description=f"오늘도 빚이… 자랐어. {note}".strip(),
-        )
-        embed.add_field(name="현재 빚", value=f"{new_debt:,}", inline=True)
-        embed.add_field(name="증가", value=f"+{delta:,}", inline=True)
-        embed.add_field(name="일일 이자율", value=f"{rate * 100:.2f}%", inline=True)
+        fields = [
+            {"name": "현재 빚", "value": f"{new_debt:,}", "inline": True},
+            {"name": "증가", "value": f"+{delta:,}", "inline": True},
+            {"name": "일일 이자율", "value": f"{rate * 100:.2f}%", "inline": True},
+        ]
         if stage_txt:
-            embed.add_field(name="채무 압박", value=stage_txt, inline=True)
+            fields.append({"name": "채무 압박", "value": stage_txt, "inline": True})
+        embed = discord.Embed.from_dict(
+            {
+                "title": "아비도스 채무 갱신",
+                "description": f"오늘도 빚이… 자랐어. {note}".strip(),
+                "fields": fields,
+            }
+        )
 
         try:
             await ch.send(embed=embed)
         except Exception:
             return
 
-        # Mark announced for today (even if we applied multiple days)
-        try:
-            set_config(key_last, str(today_ymd))
-        except Exception:
-            pass
-
     async def _maybe_announce_change(self, prev_weather: str, new_weather: str, state: dict) -> None:
         chan_id_s = get_config("aby_weather_announce_channel_id", None)
         if not chan_id_s:
@@ -257,14 +338,8 @@ class AbyEnvironmentCog(commands.Cog):
         except Exception:
             return
 
-        ch = self.bot.get_channel(chan_id)
+        ch = await self._resolve_announce_channel(chan_id)
         if ch is None:
-            try:
-                ch = await self.bot.fetch_channel(chan_id)
-            except Exception:
-                return
-
-        if not isinstance(ch, (discord.TextChannel, discord.Thread)):
             return
 
         label_prev = WEATHER_LABEL.get(prev_weather, prev_weather)
@@ -273,14 +348,18 @@ class AbyEnvironmentCog(commands.Cog):
         changed_at = int(state.get("weather_changed_at") or 0)
         next_at = int(state.get("weather_next_change_at") or 0)
 
-        embed = discord.Embed(
-            title="아비도스 환경 변화",
-            description=_weather_one_liner(new_weather),
-            color=discord.Color.orange(),
+        embed = discord.Embed.from_dict(
+            {
+                "title": "아비도스 환경 변화",
+                "description": _weather_one_liner(new_weather),
+                "color": _COLOR_ORANGE,
+                "fields": [
+                    {"name": "변화", "value": f"`{label_prev}` → `{label_new}`", "inline": False},
+                    {"name": "변화 시각", "value": f"`{fmt_kst(changed_at)}`", "inline": True},
+                    {"name": "다음 변화(예상)", "value": f"`{fmt_kst(next_at)}`", "inline": True},
+                ],
+            }
         )
-        embed.add_field(name="변화", value=f"`{label_prev}` → `{label_new}`", inline=False)
-        embed.add_field(name="변화 시각", value=f"`{_fmt_kst(changed_at)}`", inline=True)
-        embed.add_field(name="다음 변화(예상)", value=f"`{_fmt_kst(next_at)}`", inline=True)
 
         try:
             await ch.send(embed=embed)
@@ -292,8 +371,14 @@ class AbyEnvironmentCog(commands.Cog):
     async def weather_status(self, ctx: commands.Context) -> None:
         """현재 아비도스 가상 날씨를 보여줘요."""
         try:
-            # Phase2: background loop also rotates; this is still safe and idempotent.
-            state = ensure_world_weather_rotated()
+            # Phase2: background loop already rotates, so the common case is a plain read.
+            # Fall back to ensure_world_weather_rotated only when a rotation is due
+            # (or next_change_at looks broken and needs the store-side repair).
+            now = int(time.time())
+            state = get_world_state()
+            next_at = int(state.get("weather_next_change_at") or 0)
+            if not (now < next_at <= now + 14 * 24 * 3600):
+                state = ensure_world_weather_rotated(now_ts=now, state=state)
         except Exception:
             await send_ctx(ctx, "날씨 기록을 읽다가 모래가… 들어갔나 봐. 잠깐 뒤에 다시 해줄래?", allow_glitch=False)
             return
@@ -304,14 +389,18 @@ class AbyEnvironmentCog(commands.Cog):
         changed_at = int(state.get("weather_changed_at") or 0)
         next_at = int(state.get("weather_next_change_at") or 0)
 
-        embed = discord.Embed(
-            title="아비도스 환경 리포트",
-            description=_weather_one_liner(weather),
-            color=discord.Color.gold(),
+        embed = discord.Embed.from_dict(
+            {
+                "title": "아비도스 환경 리포트",
+                "description": _weather_one_liner(weather),
+                "color": _COLOR_GOLD,
+                "fields": [
+                    {"name": "현재 날씨", "value": f"`{label}`", "inline": True},
+                    {"name": "마지막 변화", "value": f"`{fmt_kst(changed_at)}`", "inline": True},
+                    {"name": "다음 변화(예상)", "value": f"`{fmt_kst(next_at)}`", "inline": True},
+                ],
+            }
         )
-        embed.add_field(name="현재 날씨", value=f"`{label}`", inline=True)
-        embed.add_field(name="마지막 변화", value=f"`{_fmt_kst(changed_at)}`", inline=True)
-        embed.add_field(name="다음 변화(예상)", value=f"`{_fmt_kst(next_at)}`", inline=True)
 
         await ctx.send(embed=embed)
 
@@ -353,7 +442,7 @@ class AbyEnvironmentCog(commands.Cog):
         else:
             # Try parse raw id
             try:
-                cid = int(re.sub(r"[^0-9]", "", a))
+                cid = int(a.translate(_KEEP_DIGITS))
                 ch = self.bot.get_channel(cid)
             except Exception:
                 ch = None
@@ -392,9 +481,14 @@ class AbyEnvironmentCog(commands.Cog):
         except Exception:
             await send_ctx(ctx, "설정하다가 모래폭풍이… 덮쳤어. 다시 한 번만!", allow_glitch=False)
             return
+        self._schedule_wakeup(next_at, now)
 
-        await send_ctx(ctx, f"오케이~ 지금부터 `{WEATHER_LABEL.get(w, w)}`! 다음 변화는 `{_fmt_kst(next_at)}`쯤이야.")
+        await send_ctx(ctx, f"오케이~ 지금부터 `{WEATHER_LABEL.get(w, w)}`! 다음 변화는 `{fmt_kst(next_at)}`쯤이야.")
 
 
 async def setup(bot: commands.Bot):
+    # Only one environment cog per bot: a second copy would double every loop tick.
+    if bot.get_cog(AbyEnvironmentCog.__cog_name__) is not None:
+        logger.warning("AbyEnvironment: cog already loaded; skipping duplicate setup")
+        return
     await bot.add_cog(AbyEnvironmentCog(bot))
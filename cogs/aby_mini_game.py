@@ -1,31 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import bisect
 import datetime
 import logging
 import random
 import re
 import time
-from decimal import Decimal, ROUND_CEILING
 from typing import Optional
 
 import discord
 from discord.ext import commands
 
 from yume_honorific import get_honorific
-from yume_send import send_ctx
+from yume_send import fmt_kst, send_ctx
 from yume_store import (
     apply_guild_interest_upto_today,
-    claim_daily_explore,
-    upsert_explore_meta,
+    apply_explore_result,
+    apply_interest_once,
+    has_explored_today,
     ensure_world_weather_rotated,
     get_guild_debt,
     get_user_economy,
     get_user_inventory,
-    add_user_item,
     consume_user_item,
     ensure_user_buff_valid,
     set_user_buff,
-    consume_user_buff_stack,
     repay_guild_debt,
     ABY_DEFAULT_DEBT,
     ABY_DEFAULT_INTEREST_RATE,
@@ -43,6 +43,8 @@ logger = logging.getLogger(__name__)
 
 OWNER_ID = 1433962010785349634
 
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
 
 WEATHER_LABEL = {
     "clear": "맑음",
@@ -101,45 +103,152 @@ ITEM_ALIASES = {
 
 MATERIAL_KEYS = {"scrap", "cloth", "filter", "battery", "circuit"}
 
+_ITEM_NAME = {k: str(v["name"]) for k, v in ITEMS.items()}
+
+
+# !탐사: calc_weather -> (success_p, success credit range, fail credit range, water_p)
+_EXPLORE_WEATHER_PARAMS = {
+    "sandstorm": (0.55, (4_000, 12_000), (0, 2_000), 0.02),
+    "cloudy": (0.70, (6_000, 15_000), (0, 3_000), 0.06),
+    "clear": (0.72, (7_000, 16_000), (0, 3_000), 0.06),
+}
+
+# !탐사 재료 드랍(1회 최대 1종): (누적 확률 상한, 아이템 키, (최소, 최대) 수량)
+_EXPLORE_MAT_TABLE_STORM = (
+    (0.26, "scrap", (2, 3)),
+    (0.34, "cloth", (1, 1)),
+    (0.38, "filter", (1, 1)),
+    (0.41, "battery", (1, 1)),
+    (0.43, "circuit", (1, 1)),
+)
+_EXPLORE_MAT_TABLE_NORMAL = (
+    (0.18, "scrap", (1, 2)),
+    (0.26, "cloth", (1, 1)),
+    (0.31, "filter", (1, 1)),
+    (0.34, "battery", (1, 1)),
+    (0.36, "circuit", (1, 1)),
+)
+
+
+_EXPLORE_MAT_THRESHOLDS_STORM = tuple(t for t, _, _ in _EXPLORE_MAT_TABLE_STORM)
+_EXPLORE_MAT_THRESHOLDS_NORMAL = tuple(t for t, _, _ in _EXPLORE_MAT_TABLE_NORMAL)
+
+# !탐사 랜덤 조우: bisect_right(thresholds, r) 번째 조우 (범위 밖이면 조우 없음)
+# 조우별 효과는 같은 인덱스의 병렬 튜플에 있다 (크레딧 범위/부호, 물, 아이템).
+_EXPLORE_ENCOUNTER_THRESHOLDS = (0.12, 0.17, 0.21, 0.24, 0.28)
+_EXPLORE_ENCOUNTERS = ("bonus", "loss", "mask", "drone", "water")
+_EXPLORE_ENC_CREDIT_RNG = ((2_000, 9_000), (1_000, 4_000), None, None, None)
+_EXPLORE_ENC_CREDIT_SIGN = (1, -1, 0, 0, 0)
+_EXPLORE_ENC_WATER = (0, 0, 0, 0, 1)
+_EXPLORE_ENC_ITEM = ("", "", "mask", "drone", "")
+_EXPLORE_ENCOUNTER_LINES = {
+    "bonus": "- 조우: **잊혀진 상자** (+{amount} 크레딧)",
+    "loss": "- 조우: **모래에 미끄러짐** (-{amount} 크레딧)",
+    "mask": "- 조우: **방진마스크**를 주웠어!",
+    "drone": "- 조우: **탐사용 드론** 잔해를 살렸어!",
+    "water": "- 조우: **물통** 발견! (+1 물)",
+}
+
+# !탐사 flavor: (날씨, 방진마스크 사용, 성공) -> 대사 후보
+_EXPLORE_FLAVOR = {
+    ("sandstorm", True, True): (
+        "방진마스크 덕분에… 숨 좀 쉬겠더라. 그래도 뭐 하나 주웠어!",
+        "바람은 미쳤는데… 마스크가 버텨줬어. 으헤~",
+        "시야가 흐릿했지만… 마스크로 버티면서 수확 성공!",
+    ),
+    ("sandstorm", True, False): (
+        "마스크가 있어도… 오늘 바람은 진짜 무리였어…",
+        "버텨보려 했는데… 모래가 전부 덮었어… 퇴각!",
+        "마스크 필터가… 지지직… 다음에 다시 가자.",
+    ),
+    ("sandstorm", False, True): (
+        "모래폭풍 속에서도… 뭔가 반짝이는 걸 주웠어! 으헤~",
+        "시야가 거의 안 보였는데… 손에 잡히는 게 있더라…!",
+        "입에 모래… 퉤퉤… 그래도 성과는 있었어.",
+    ),
+    ("sandstorm", False, False): (
+        "바람이 너무 세서… 거의 아무것도 못 챙겼어… 지지직…",
+        "모래가 다 내 편지를… 아니 내 포스터를…!",
+        "퇴각! 퇴각! 오늘은… 진짜 무리야…",
+    ),
+    ("cloudy", False, True): (
+        "하늘이 흐려도… 발밑은 반짝이네!",
+        "기분은 좀 축축하지만, 수확은 괜찮아.",
+        "구름 아래에서… 의외로 찾기 쉬웠어.",
+    ),
+    ("cloudy", False, False): (
+        "흐린 날은… 길을 자꾸 헷갈려.",
+        "오늘은 꽝… 다음엔 더 잘할 수 있어.",
+        "발자국만 잔뜩 남겼다…",
+    ),
+    ("clear", False, True): (
+        "모래 사이에서 반짝이는 걸 발견했어!",
+        "오아시스…는 아니지만, 그 근처였던 것 같아…",
+        "호시노 짱이랑 같이 걸었다고 상상하니까 힘이 나네…",
+    ),
+    ("clear", False, False): (
+        "바람이 너무 세서 거의 아무것도 못 챙겼어… 퉤퉤.",
+        "발자국만 잔뜩 남겼다… 다음엔 더 잘할 수 있어.",
+        "모래가… 입에… 들어왔어… 으아아…",
+    ),
+}
+
 
-def _apply_interest_once(debt: int, rate: float) -> int:
-    """Match yume_store._apply_interest_once rounding (ceil)."""
+_WS_RE = re.compile(r"\s+")
 
-    d = Decimal(int(debt))
-    r = Decimal(str(rate))
-    new_val = (d * (Decimal("1") + r)).to_integral_value(rounding=ROUND_CEILING)
-    return int(new_val) if new_val > 0 else 0
+
+def _norm_item_name(s: str) -> str:
+    return _WS_RE.sub("", s).lower()
+
+
+# !사용 lookup: normalized display name or alias -> item key (aliases win).
+_NAME_TO_KEY = {
+    **{_norm_item_name(str(meta.get("name") or "")): k for k, meta in ITEMS.items()},
+    **ITEM_ALIASES,
+}
 
 
 def _now_kst() -> datetime.datetime:
-    return datetime.datetime.utcnow() + datetime.timedelta(hours=9)
+    return datetime.datetime.now(KST)
 
 
-def _today_ymd_kst() -> str:
-    return _now_kst().date().isoformat()
+# (다음 KST 자정 epoch, "YYYY-MM-DD") - 날짜는 자정에만 바뀌니까 그때까지 그대로 쓴다.
+_cached_ymd = (0, "")
 
 
-def _fmt_ts_kst(ts: int) -> str:
-    if not ts:
-        return "-"
-    dt = datetime.datetime.fromtimestamp(int(ts), tz=datetime.timezone(datetime.timedelta(hours=9)))
-    return dt.strftime("%m/%d %H:%M")
+def _today_ymd_kst() -> str:
+    global _cached_ymd
+    now = time.time()
+    if now >= _cached_ymd[0]:
+        t = int(now) + 9 * 3600
+        next_midnight = t - t % 86400 + 86400 - 9 * 3600
+        _cached_ymd = (next_midnight, time.strftime("%Y-%m-%d", time.gmtime(t)))
+    return _cached_ymd[1]
 
 
 def _fmt(n: int) -> str:
+    if type(n) is int:
+        return format(n, ",")
     try:
-        return f"{int(n):,}"
+        return format(int(n), ",")
     except Exception:
         return str(n)
 
 
-_KOREAN_UNIT = {
+# Amount suffix -> multiplier (1k / 3m / 2b, and single Korean units 천/만/억).
+_AMOUNT_SUFFIX_MULT = {
+    "k": 1_000,
+    "m": 1_000_000,
+    "b": 1_000_000_000,
     "천": 1_000,
     "만": 10_000,
     "억": 100_000_000,
 }
 
 
+_RE_CHANNEL_MENTION = re.compile(r"<#(\d+)>")
+
+
 def _parse_amount(raw: str) -> Optional[int]:
     """Parse user amount.
 
@@ -159,25 +268,41 @@ def _parse_amount(raw: str) -> Optional[int]:
     if s in {"all", "전체", "전부", "올인"}:
         return -1
 
-    m = re.fullmatch(r"(\d+)([kmb])", s)
-    if m:
-        v = int(m.group(1))
-        mult = {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000}[m.group(2)]
-        return v * mult
-
-    # Korean unit (single unit)
-    m = re.fullmatch(r"(\d+)(천|만|억)", s)
-    if m:
-        v = int(m.group(1))
-        return v * _KOREAN_UNIT[m.group(2)]
+    # isdecimal() matches what r"\d+" accepted, and int() takes the same strings.
+    mult = _AMOUNT_SUFFIX_MULT.get(s[-1])
+    if mult is not None:
+        head = s[:-1]
+        return int(head) * mult if head.isdecimal() else None
 
     # plain integer
-    if re.fullmatch(r"\d+", s):
+    if s.isdecimal():
         return int(s)
 
     return None
 
 
+# !탐사지원: 호칭 뒤에 붙는 본문 (상수라 import 때 한 번만 만든다)
+_EXPLORE_HELP_BODY = (
+    "아비도스 탐사 지원센터야. (유메 선배가 만든... 잔뜩 허술한 안내서)\n\n"
+    "**기본 커맨드**\n"
+    "- `!탐사` : 하루 1회 탐사해서 크레딧(가끔 물) 얻기\n"
+    "- `!지갑` : 내 재화 확인\n"
+    "- `!가방` : 탐사 전리품(아이템) 확인\n"
+    "- `!사용 <아이템>` : 아이템 사용 (버프)\n- `!공방` : 제작/판매 안내\n- `!제작 <아이템>` : 아이템 제작\n- `!판매 <재료> [수량|전체]` : 재료 판매\n- `!의뢰` : 의뢰 게시판 보기(일일/주간)\n- `!납품 <번호>` : 의뢰 보상 받기(조건 달성 시)\n- `!의뢰랭킹` : 주간 의뢰 포인트 랭킹\n"
+    "- `!빚현황` : 우리 학교 빚/이자 확인\n"
+    "- `!빚상환 <금액|전체>` : 내 크레딧으로 빚 상환\n\n"
+    "- `!이자내역` : 최근 이자/상환 기록 보기\n"
+    "- `!빚알림 [#채널|끄기]` : 이자 반영 시 자동 알림 채널 설정\n\n"
+    "**환경(날씨)**\n"
+    "- `!날씨` : 아비도스 가상 날씨 확인\n"
+    "- 날씨에 따라 `!탐사` 성공률/보상이 조금 변해\n\n"
+    "**스토리**\n"
+    f"- 시작 빚: **{_fmt(ABY_DEFAULT_DEBT)} 크레딧**\n"
+    f"- 일일 이자율: **{ABY_DEFAULT_INTEREST_RATE * 100:.2f}%** (매일 한 번 적용)\n\n"
+    "으헤헤… 갚을 수 있을지는 모르겠지만, 그래도… 같이 노력해보자.\n"
+)
+
+
 class AbyMiniGameCog(commands.Cog):
     """Abydos 탐사/부채 미니게임 (Phase6-2)."""
 
@@ -191,26 +316,7 @@ class AbyMiniGameCog(commands.Cog):
     @commands.command(name="탐사지원")
     async def explore_help(self, ctx: commands.Context):
         hon = get_honorific(ctx.author, ctx.guild)
-        txt = (
-            f"{hon}~ 아비도스 탐사 지원센터야. (유메 선배가 만든... 잔뜩 허술한 안내서)\n\n"
-            "**기본 커맨드**\n"
-            "- `!탐사` : 하루 1회 탐사해서 크레딧(가끔 물) 얻기\n"
-            "- `!지갑` : 내 재화 확인\n"
-            "- `!가방` : 탐사 전리품(아이템) 확인\n"
-            "- `!사용 <아이템>` : 아이템 사용 (버프)\n- `!공방` : 제작/판매 안내\n- `!제작 <아이템>` : 아이템 제작\n- `!판매 <재료> [수량|전체]` : 재료 판매\n- `!의뢰` : 의뢰 게시판 보기(일일/주간)\n- `!납품 <번호>` : 의뢰 보상 받기(조건 달성 시)\n- `!의뢰랭킹` : 주간 의뢰 포인트 랭킹\n"
-            "- `!빚현황` : 우리 학교 빚/이자 확인\n"
-            "- `!빚상환 <금액|전체>` : 내 크레딧으로 빚 상환\n\n"
-            "- `!이자내역` : 최근 이자/상환 기록 보기\n"
-            "- `!빚알림 [#채널|끄기]` : 이자 반영 시 자동 알림 채널 설정\n\n"
-            "**환경(날씨)**\n"
-            "- `!날씨` : 아비도스 가상 날씨 확인\n"
-            "- 날씨에 따라 `!탐사` 성공률/보상이 조금 변해\n\n"
-            "**스토리**\n"
-            f"- 시작 빚: **{_fmt(ABY_DEFAULT_DEBT)} 크레딧**\n"
-            f"- 일일 이자율: **{ABY_DEFAULT_INTEREST_RATE * 100:.2f}%** (매일 한 번 적용)\n\n"
-            "으헤헤… 갚을 수 있을지는 모르겠지만, 그래도… 같이 노력해보자.\n"
-        )
-        await send_ctx(ctx, txt, allow_glitch=True)
+        await send_ctx(ctx, f"{hon}~ " + _EXPLORE_HELP_BODY, allow_glitch=True)
 
     # ------------------------------
     # Wallet
@@ -237,25 +343,22 @@ class AbyMiniGameCog(commands.Cog):
     @commands.command(name="가방", aliases=["인벤", "인벤토리", "전리품"])
     async def bag(self, ctx: commands.Context):
         inv = get_user_inventory(ctx.author.id)
-        buff = ensure_user_buff_valid(ctx.author.id)
+        bkey, stacks, exp = ensure_user_buff_valid(ctx.author.id)
 
         hon = get_honorific(ctx.author, ctx.guild)
 
         lines = [f"{hon} 가방 열어봤어."]
 
         # Active buff
-        bkey = str(buff.get("buff_key") or "").strip().lower()
-        stacks = int(buff.get("stacks") or 0)
-        exp = int(buff.get("expires_at") or 0)
         if bkey and stacks > 0:
             if bkey == "mask":
-                lines.append(f"- 활성 버프: **방진마스크** (만료 `{_fmt_ts_kst(exp)}`)")
+                lines.append(f"- 활성 버프: **방진마스크** (만료 `{fmt_kst(exp)}`)")
             elif bkey == "drone":
-                lines.append(f"- 활성 버프: **탐사용 드론** (남은 {stacks}회, 만료 `{_fmt_ts_kst(exp)}`)")
+                lines.append(f"- 활성 버프: **탐사용 드론** (남은 {stacks}회, 만료 `{fmt_kst(exp)}`)")
             elif bkey == "kit":
-                lines.append(f"- 활성 버프: **탐사키트** (남은 {stacks}회, 만료 `{_fmt_ts_kst(exp)}`)")
+                lines.append(f"- 활성 버프: **탐사키트** (남은 {stacks}회, 만료 `{fmt_kst(exp)}`)")
             else:
-                lines.append(f"- 활성 버프: **{bkey}** (만료 `{_fmt_ts_kst(exp)}`)")
+                lines.append(f"- 활성 버프: **{bkey}** (만료 `{fmt_kst(exp)}`)")
         else:
             lines.append("- 활성 버프: 없음")
 
@@ -264,9 +367,9 @@ class AbyMiniGameCog(commands.Cog):
             lines.append("- 전리품: (텅)\n탐사하다가 주워오면 여기 쌓여. 으헤~")
         else:
             lines.append("- 전리품:")
-            for k, qty in sorted(inv.items(), key=lambda x: x[0]):
-                meta = ITEMS.get(k)
-                name = meta.get("name") if meta else k
+            # get_user_inventory already returns keys in ORDER BY item_key order.
+            for k, qty in inv.items():
+                name = _ITEM_NAME.get(k, k)
                 lines.append(f"  • {name}: **{_fmt(qty)}**")
 
         lines.append("\n사용: `!사용 방진마스크` / `!사용 드론` / `!사용 탐사키트`")
@@ -281,18 +384,7 @@ class AbyMiniGameCog(commands.Cog):
             await send_ctx(ctx, f"{hon} 사용법: `!사용 <아이템>`\n예) `!사용 방진마스크` / `!사용 드론` / `!사용 탐사키트`", allow_glitch=True)
             return
 
-        key = None
-        norm = re.sub(r"\s+", "", raw).lower()
-
-        # Direct alias
-        if norm in ITEM_ALIASES:
-            key = ITEM_ALIASES[norm]
-        else:
-            # Try match by display name
-            for k, meta in ITEMS.items():
-                if norm == re.sub(r"\s+", "", str(meta.get("name") or "")).lower():
-                    key = k
-                    break
+        key = _NAME_TO_KEY.get(_norm_item_name(raw))
 
         if key not in ITEMS:
             avail = ", ".join([m["name"] for m in ITEMS.values()])
@@ -303,10 +395,9 @@ class AbyMiniGameCog(commands.Cog):
 
         # 재료 아이템은 여기서 사용하지 않아요(실수로 소모 방지)
         if key not in {"mask", "drone", "kit"}:
-            meta = ITEMS.get(key) or {"name": key}
             await send_ctx(
                 ctx,
-                f"{hon} 그건 그냥 재료야.\n`!공방`에서 제작하거나 `!판매`로 팔 수 있어. (아이템: {meta.get('name')})",
+                f"{hon} 그건 그냥 재료야.\n`!공방`에서 제작하거나 `!판매`로 팔 수 있어. (아이템: {_ITEM_NAME.get(key, key)})",
                 allow_glitch=True,
             )
             return
@@ -317,9 +408,7 @@ class AbyMiniGameCog(commands.Cog):
             return
 
         now = int(time.time())
-        prev = ensure_user_buff_valid(ctx.author.id, now=now)
-        prev_key = str(prev.get("buff_key") or "").strip().lower()
-        prev_stacks = int(prev.get("stacks") or 0)
+        prev_key, prev_stacks, _ = ensure_user_buff_valid(ctx.author.id, now=now)
 
         if key == "mask":
             exp = now + 2 * 3600
@@ -327,7 +416,7 @@ class AbyMiniGameCog(commands.Cog):
             extra = ""
             if prev_key and prev_stacks > 0 and prev_key != "mask":
                 extra = " (기존 버프는 덮어썼어…)"
-            await send_ctx(ctx, f"{hon} 방진마스크 장착!{extra}\n2시간 동안 모래폭풍이 좀… 덜 아파. (만료 `{_fmt_ts_kst(exp)}`)")
+            await send_ctx(ctx, f"{hon} 방진마스크 장착!{extra}\n2시간 동안 모래폭풍이 좀… 덜 아파. (만료 `{fmt_kst(exp)}`)")
             return
 
         if key == "drone":
@@ -336,7 +425,7 @@ class AbyMiniGameCog(commands.Cog):
             extra = ""
             if prev_key and prev_stacks > 0 and prev_key != "drone":
                 extra = " (기존 버프는 덮어썼어…)"
-            await send_ctx(ctx, f"{hon} 탐사용 드론 준비 완료!{extra}\n다음 탐사에서 크레딧이 **+25%** (1회). (만료 `{_fmt_ts_kst(exp)}`)")
+            await send_ctx(ctx, f"{hon} 탐사용 드론 준비 완료!{extra}\n다음 탐사에서 크레딧이 **+25%** (1회). (만료 `{fmt_kst(exp)}`)")
             return
 
 
@@ -346,7 +435,7 @@ class AbyMiniGameCog(commands.Cog):
             extra = ""
             if prev_key and prev_stacks > 0 and prev_key != "kit":
                 extra = " (기존 버프는 덮어썼어…)"
-            await send_ctx(ctx, f"{hon} 탐사키트 준비 완료!{extra}\n다음 탐사에서 성공률이 **+10%** (1회). (만료 `{_fmt_ts_kst(exp)}`)")
+            await send_ctx(ctx, f"{hon} 탐사키트 준비 완료!{extra}\n다음 탐사에서 성공률이 **+10%** (1회). (만료 `{fmt_kst(exp)}`)")
             return
 
         # Fallback (shouldn't happen)
@@ -367,8 +456,7 @@ class AbyMiniGameCog(commands.Cog):
         hon = get_honorific(ctx.author, ctx.guild)
 
         # 중복 지급(전리품/버프 악용) 방지: 먼저 오늘 탐사 여부를 빠르게 확인한다.
-        econ0 = get_user_economy(ctx.author.id)
-        if str(econ0.get("last_explore_ymd") or "") == today:
+        if has_explored_today(ctx.author.id, today):
             txt = (
                 f"{hon}… 오늘은 이미 탐사 다녀왔어.\n"
                 "하루 1회만! (유메 선배 수첩에 적혀있어…)\n"
@@ -385,9 +473,7 @@ class AbyMiniGameCog(commands.Cog):
         except Exception:
             weather = "clear"
 
-        buff = ensure_user_buff_valid(ctx.author.id)
-        bkey = str(buff.get("buff_key") or "").strip().lower()
-        bstacks = int(buff.get("stacks") or 0)
+        bkey, bstacks, _ = ensure_user_buff_valid(ctx.author.id)
 
         calc_weather = weather
         mask_used = False
@@ -395,24 +481,9 @@ class AbyMiniGameCog(commands.Cog):
             calc_weather = "cloudy"
             mask_used = True
 
-        label_env = WEATHER_LABEL.get(weather, weather)
-        label_calc = WEATHER_LABEL.get(calc_weather, calc_weather)
-
-        if calc_weather == "sandstorm":
-            success_p = 0.55
-            succ_rng = (4_000, 12_000)
-            fail_rng = (0, 2_000)
-            water_p = 0.02
-        elif calc_weather == "cloudy":
-            success_p = 0.70
-            succ_rng = (6_000, 15_000)
-            fail_rng = (0, 3_000)
-            water_p = 0.06
-        else:
-            success_p = 0.72
-            succ_rng = (7_000, 16_000)
-            fail_rng = (0, 3_000)
-            water_p = 0.06
+        success_p, succ_rng, fail_rng, water_p = _EXPLORE_WEATHER_PARAMS.get(
+            calc_weather, _EXPLORE_WEATHER_PARAMS["clear"]
+        )
 
         # Phase4: 탐사키트(성공률 +10%, 1회)
         kit_applied = False
@@ -429,66 +500,36 @@ class AbyMiniGameCog(commands.Cog):
 
         water = 1 if (random.random() < water_p) else 0
 
-        # Phase3: 랜덤 조우/전리품
-        encounter_lines: list[str] = []
+        # Phase3: 랜덤 조우/전리품 (문구는 탐사가 실제로 반영된 뒤에만 만든다)
         items_to_add: list[tuple[str, int]] = []
-        r = random.random()
-        if r < 0.12:
-            bonus = random.randint(2_000, 9_000)
-            credits += bonus
-            encounter_lines.append(f"- 조우: **잊혀진 상자** (+{_fmt(bonus)} 크레딧)")
-        elif r < 0.17:
-            loss = random.randint(1_000, 4_000)
-            credits -= loss
-            encounter_lines.append(f"- 조우: **모래에 미끄러짐** (-{_fmt(loss)} 크레딧)")
-        elif r < 0.21:
-            items_to_add.append(("mask", 1))
-            encounter_lines.append("- 조우: **방진마스크**를 주웠어!")
-        elif r < 0.24:
-            items_to_add.append(("drone", 1))
-            encounter_lines.append("- 조우: **탐사용 드론** 잔해를 살렸어!")
-        elif r < 0.28:
-            water += 1
-            encounter_lines.append("- 조우: **물통** 발견! (+1 물)")
+        idx = bisect.bisect_right(_EXPLORE_ENCOUNTER_THRESHOLDS, random.random())
+        encounter = None
+        enc_amount = 0
+        if idx < len(_EXPLORE_ENCOUNTERS):
+            encounter = _EXPLORE_ENCOUNTERS[idx]
+            credit_rng = _EXPLORE_ENC_CREDIT_RNG[idx]
+            if credit_rng is not None:
+                enc_amount = random.randint(*credit_rng)
+                credits += _EXPLORE_ENC_CREDIT_SIGN[idx] * enc_amount
+            water += _EXPLORE_ENC_WATER[idx]
+            enc_item = _EXPLORE_ENC_ITEM[idx]
+            if enc_item:
+                items_to_add.append((enc_item, 1))
 
         # Phase4: 공방 재료(고철/천/필터/배터리/회로)
         # - 탐사 1회당 최대 1종만 드랍
         mr = random.random()
         mat_key = None
         mat_qty = 0
+        # 폭풍 속엔 고철이 더 굴러다녀…
         if calc_weather == "sandstorm":
-            # 폭풍 속엔 고철이 더 굴러다녀…
-            if mr < 0.26:
-                mat_key = "scrap"
-                mat_qty = random.randint(2, 3)
-            elif mr < 0.34:
-                mat_key = "cloth"
-                mat_qty = 1
-            elif mr < 0.38:
-                mat_key = "filter"
-                mat_qty = 1
-            elif mr < 0.41:
-                mat_key = "battery"
-                mat_qty = 1
-            elif mr < 0.43:
-                mat_key = "circuit"
-                mat_qty = 1
+            mat_table, mat_thresholds = _EXPLORE_MAT_TABLE_STORM, _EXPLORE_MAT_THRESHOLDS_STORM
         else:
-            if mr < 0.18:
-                mat_key = "scrap"
-                mat_qty = random.randint(1, 2)
-            elif mr < 0.26:
-                mat_key = "cloth"
-                mat_qty = 1
-            elif mr < 0.31:
-                mat_key = "filter"
-                mat_qty = 1
-            elif mr < 0.34:
-                mat_key = "battery"
-                mat_qty = 1
-            elif mr < 0.36:
-                mat_key = "circuit"
-                mat_qty = 1
+            mat_table, mat_thresholds = _EXPLORE_MAT_TABLE_NORMAL, _EXPLORE_MAT_THRESHOLDS_NORMAL
+        idx = bisect.bisect_right(mat_thresholds, mr)
+        if idx < len(mat_table):
+            _, mat_key, (q_lo, q_hi) = mat_table[idx]
+            mat_qty = random.randint(q_lo, q_hi) if q_lo != q_hi else q_lo
 
         if mat_key and mat_qty > 0:
             items_to_add.append((mat_key, mat_qty))
@@ -497,13 +538,25 @@ class AbyMiniGameCog(commands.Cog):
         drone_applied = False
         if bkey == "drone" and bstacks > 0:
             if credits > 0:
-                mult = Decimal("1.25")
-                credits = int((Decimal(int(credits)) * mult).to_integral_value(rounding=ROUND_CEILING))
+                # ceil(credits * 1.25) in ints
+                credits = -((-int(credits) * 5) // 4)
                 drone_applied = True
 
-        result = claim_daily_explore(ctx.author.id, today, credits, water)
+        # 탐사 보상/메타/전리품/버프 소모를 한 트랜잭션으로 반영한다.
+        # (이미 오늘 탐사했으면 None이고 아무것도 쓰지 않는다 → 전리품/버프가 새지 않음)
+        # 쓰기 락을 기다릴 수도 있으니 이벤트 루프 밖(스레드)에서 돌린다.
+        result = await asyncio.to_thread(
+            apply_explore_result,
+            ctx.author.id,
+            today,
+            credits,
+            water,
+            weather=weather,
+            success=success,
+            items=items_to_add,
+            consume_buff=bkey in {"drone", "kit"} and bstacks > 0,
+        )
         if result is None:
-            # 레이스 상황(거의 없음)에서도 전리품/버프가 새지 않도록 조용히 끝낸다.
             txt = (
                 f"{hon}… 오늘은 이미 탐사 다녀왔어.\n"
                 "하루 1회만! (유메 선배 수첩에 적혀있어…)\n"
@@ -511,97 +564,12 @@ class AbyMiniGameCog(commands.Cog):
             await send_ctx(ctx, txt, allow_glitch=True)
             return
 
-
-        # Phase5: 탐사 메타(날씨/성공 여부) 기록(퀘스트 검증용). 실패해도 게임은 계속 진행.
-        try:
-            upsert_explore_meta(
-                ctx.author.id,
-                today,
-                weather=weather,
-                success=success,
-                credits_delta=int(credits),
-                water_delta=int(water),
-            )
-        except Exception:
-            pass
-        # 성공적으로 반영된 후에만 전리품/버프 소모를 적용한다.
-        for k, q in items_to_add:
-            add_user_item(ctx.author.id, k, q)
-        if bkey in {"drone", "kit"} and bstacks > 0:
-            consume_user_buff_stack(ctx.author.id)
-
         new_credits = int(result.get("credits", 0))
         new_water = int(result.get("water", 0))
 
         # Flavor
-        if weather == "sandstorm" and mask_used:
-            if success:
-                flavor = random.choice(
-                    [
-                        "방진마스크 덕분에… 숨 좀 쉬겠더라. 그래도 뭐 하나 주웠어!",
-                        "바람은 미쳤는데… 마스크가 버텨줬어. 으헤~",
-                        "시야가 흐릿했지만… 마스크로 버티면서 수확 성공!",
-                    ]
-                )
-            else:
-                flavor = random.choice(
-                    [
-                        "마스크가 있어도… 오늘 바람은 진짜 무리였어…",
-                        "버텨보려 했는데… 모래가 전부 덮었어… 퇴각!",
-                        "마스크 필터가… 지지직… 다음에 다시 가자.",
-                    ]
-                )
-        elif weather == "sandstorm":
-            if success:
-                flavor = random.choice(
-                    [
-                        "모래폭풍 속에서도… 뭔가 반짝이는 걸 주웠어! 으헤~",
-                        "시야가 거의 안 보였는데… 손에 잡히는 게 있더라…!",
-                        "입에 모래… 퉤퉤… 그래도 성과는 있었어.",
-                    ]
-                )
-            else:
-                flavor = random.choice(
-                    [
-                        "바람이 너무 세서… 거의 아무것도 못 챙겼어… 지지직…",
-                        "모래가 다 내 편지를… 아니 내 포스터를…!",
-                        "퇴각! 퇴각! 오늘은… 진짜 무리야…",
-                    ]
-                )
-        elif weather == "cloudy":
-            if success:
-                flavor = random.choice(
-                    [
-                        "하늘이 흐려도… 발밑은 반짝이네!",
-                        "기분은 좀 축축하지만, 수확은 괜찮아.",
-                        "구름 아래에서… 의외로 찾기 쉬웠어.",
-                    ]
-                )
-            else:
-                flavor = random.choice(
-                    [
-                        "흐린 날은… 길을 자꾸 헷갈려.",
-                        "오늘은 꽝… 다음엔 더 잘할 수 있어.",
-                        "발자국만 잔뜩 남겼다…",
-                    ]
-                )
-        else:
-            if success:
-                flavor = random.choice(
-                    [
-                        "모래 사이에서 반짝이는 걸 발견했어!",
-                        "오아시스…는 아니지만, 그 근처였던 것 같아…",
-                        "호시노 짱이랑 같이 걸었다고 상상하니까 힘이 나네…",
-                    ]
-                )
-            else:
-                flavor = random.choice(
-                    [
-                        "바람이 너무 세서 거의 아무것도 못 챙겼어… 퉤퉤.",
-                        "발자국만 잔뜩 남겼다… 다음엔 더 잘할 수 있어.",
-                        "모래가… 입에… 들어왔어… 으아아…",
-                    ]
-                )
+        flavor_weather = weather if weather in ("sandstorm", "cloudy") else "clear"
+        flavor = random.choice(_EXPLORE_FLAVOR[(flavor_weather, mask_used, success)])
 
         # 획득/손실 표기(Phase3: 음수 크레딧 가능)
         if credits > 0:
@@ -618,14 +586,14 @@ class AbyMiniGameCog(commands.Cog):
         loot_lines: list[str] = []
         if items_to_add:
             for k, q in items_to_add:
-                meta = ITEMS.get(k)
-                name = meta.get("name") if meta else k
+                name = _ITEM_NAME.get(k, k)
                 tag = "재료" if k in MATERIAL_KEYS else "전리품"
                 loot_lines.append(f"- {tag}: {name} x{q}")
 
+        label_env = WEATHER_LABEL.get(weather, weather)
         note = ""
         if weather != calc_weather:
-            note = f" (버프 적용: `{label_calc}`로 계산)"
+            note = f" (버프 적용: `{WEATHER_LABEL.get(calc_weather, calc_weather)}`로 계산)"
         if drone_applied:
             loot_lines.append("- 버프: 탐사용 드론 +25% 적용")
         if kit_applied:
@@ -638,12 +606,16 @@ class AbyMiniGameCog(commands.Cog):
             f"획득: {gained}",
         ]
 
-        if encounter_lines:
-            parts.append("\n" + "\n".join(encounter_lines))
+        # One flat list, one join ("" entries become the blank separator lines).
+        if encounter is not None:
+            parts.append("")
+            parts.append(_EXPLORE_ENCOUNTER_LINES[encounter].format(amount=_fmt(enc_amount)))
         if loot_lines:
-            parts.append("\n" + "\n".join(loot_lines))
+            parts.append("")
+            parts.extend(loot_lines)
 
-        parts.append(f"\n현재 보유: 크레딧 **{_fmt(new_credits)}**, 물 **{_fmt(new_water)}**")
+        parts.append("")
+        parts.append(f"현재 보유: 크레딧 **{_fmt(new_credits)}**, 물 **{_fmt(new_water)}**")
         txt = "\n".join(parts) + "\n"
         await send_ctx(ctx, txt, allow_glitch=True)
 
@@ -680,7 +652,7 @@ class AbyMiniGameCog(commands.Cog):
             pressure_line += f" (기준 대비 {ratio:.2f}x)"
         pressure_line += "\n"
 
-        tomorrow_debt = _apply_interest_once(debt, rate)
+        tomorrow_debt = apply_interest_once(debt, rate)
         tomorrow_interest = max(0, int(tomorrow_debt - debt))
 
         hon = get_honorific(ctx.author, ctx.guild)
@@ -725,7 +697,7 @@ class AbyMiniGameCog(commands.Cog):
             await send_ctx(ctx, "오케이. 빚 알림은 꺼둘게…", allow_glitch=True)
             return
 
-        m = re.search(r"<#(\d+)>", raw)
+        m = _RE_CHANNEL_MENTION.search(raw)
         if m:
             chan_id = int(m.group(1))
         elif raw.isdigit():
@@ -794,8 +766,6 @@ class AbyMiniGameCog(commands.Cog):
             return
 
         today = _today_ymd_kst()
-        econ = get_user_economy(ctx.author.id)
-        credits = int(econ.get("credits", 0))
 
         parsed = _parse_amount(amount)
         if parsed is None:
@@ -806,12 +776,9 @@ class AbyMiniGameCog(commands.Cog):
             )
             return
 
-        if parsed == -1:
-            amt = credits
-        else:
-            amt = parsed
-
-        if amt <= 0:
+        # -1 (전체) is resolved against the wallet inside repay_guild_debt's transaction.
+        amt = parsed
+        if amt <= 0 and amt != -1:
             await send_ctx(ctx, "상환 금액이… 0 이하야. 으헤~", allow_glitch=True)
             return
 
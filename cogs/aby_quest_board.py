@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import functools
 import logging
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
 
 from discord.ext import commands
 
@@ -15,11 +17,10 @@ from yume_store import (
     ensure_aby_daily_quest_board,
     ensure_aby_weekly_quest_board,
     get_aby_quests,
-    is_aby_quest_claimed,
+    get_aby_quests_claim_map,
     claim_aby_quest,
     get_user_inventory,
-    repay_total_for_day,
-    repay_total_for_week,
+    get_repay_totals,
     get_user_weekly_points,
     get_weekly_points_ranking,
     get_explore_meta,
@@ -41,6 +42,11 @@ ITEM_NAME = {
 }
 
 
+# 게시판 번호: 1..일일개수 = 일일, 그 뒤 = 주간 (주간 quest_no에 오프셋을 더해 보여준다)
+_WEEKLY_NO_OFFSET = ABY_DAILY_QUEST_COUNT
+_BOARD_NO_MAX = ABY_DAILY_QUEST_COUNT + ABY_WEEKLY_QUEST_COUNT
+
+
 def _now_kst() -> datetime.datetime:
     return datetime.datetime.utcnow() + datetime.timedelta(hours=9)
 
@@ -56,6 +62,8 @@ def _fmt(n: int) -> str:
         return str(n)
 
 
+# 보상 필드는 보드 기간 동안 바뀌지 않아서, 같은 보상 조합은 한 번만 포맷한다.
+@functools.lru_cache(maxsize=256)
 def _reward_text(points: int, credits: int, item_key: str, item_qty: int) -> str:
     parts: list[str] = []
     if points:
@@ -68,6 +76,155 @@ def _reward_text(points: int, credits: int, item_key: str, item_qty: int) -> str
     return " + ".join(parts) if parts else "-"
 
 
+def _raise_first(results: list[Any]) -> list[Any]:
+    # gather(return_exceptions=True) 결과에서 첫 예외를 다시 던진다. (나머지 작업은 이미 끝난 상태)
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+    return results
+
+
+async def _collect_board_data(gid: int, uid: int, today: str, week_key: str) -> Dict[str, Any]:
+    """!의뢰 렌더링에 필요한 DB 값을 모은다.
+
+    서로 독립적인 store 호출은 스레드로 동시에 돌린다. 의뢰 목록 조회만 보드 생성(ensure) 이후에 한다.
+    """
+
+    _, _, inv, daily_claimed, weekly_claimed = _raise_first(
+        await asyncio.gather(
+            asyncio.to_thread(ensure_aby_daily_quest_board, gid, today),
+            asyncio.to_thread(ensure_aby_weekly_quest_board, gid, week_key),
+            asyncio.to_thread(get_user_inventory, uid),
+            # 의뢰별 조회(N+1) 대신 보드 단위로 한 번씩만 읽는다.
+            asyncio.to_thread(get_aby_quests_claim_map, gid, "daily", today, uid),
+            asyncio.to_thread(get_aby_quests_claim_map, gid, "weekly", week_key, uid),
+            return_exceptions=True,
+        )
+    )
+
+    daily, weekly = _raise_first(
+        await asyncio.gather(
+            asyncio.to_thread(get_aby_quests, gid, "daily", today),
+            asyncio.to_thread(get_aby_quests, gid, "weekly", week_key),
+            return_exceptions=True,
+        )
+    )
+
+    # 진행도는 미완료 의뢰에 해당 타입이 있을 때만 조회한다. (전부 완료했으면 추가 조회 없음)
+    daily_open = {q.quest_type for q in daily if q.quest_no not in daily_claimed}
+    weekly_open = {q.quest_type for q in weekly if q.quest_no not in weekly_claimed}
+
+    jobs: Dict[str, Any] = {}
+    if "repay_total" in daily_open or "repay_total" in weekly_open:
+        jobs["repaid"] = asyncio.to_thread(get_repay_totals, gid, uid, today, week_key)
+    if "explore_done" in daily_open:
+        jobs["meta"] = asyncio.to_thread(get_explore_meta, uid, today)
+    if "explore_sandstorm_success" in weekly_open:
+        jobs["sandstorm"] = asyncio.to_thread(has_sandstorm_success_in_week, uid, week_key)
+
+    progress: Dict[str, Any] = {}
+    if jobs:
+        progress = dict(zip(jobs, _raise_first(await asyncio.gather(*jobs.values(), return_exceptions=True))))
+    day_repaid, week_repaid = progress.get("repaid") or (0, 0)
+
+    return {
+        "daily": daily,
+        "weekly": weekly,
+        "inv": inv,
+        "daily_claimed": daily_claimed,
+        "weekly_claimed": weekly_claimed,
+        "day_repaid": day_repaid,
+        "week_repaid": week_repaid,
+        "explore_done": bool(progress.get("meta")),
+        "sandstorm_done": bool(progress.get("sandstorm")),
+    }
+
+
+def _ensure_and_claim(
+    gid: int, uid: int, scope: str, board_key: str, quest_no: int, today: str, week_key: str
+) -> Dict[str, Any]:
+    ensure_aby_daily_quest_board(gid, today)
+    ensure_aby_weekly_quest_board(gid, week_key)
+    return claim_aby_quest(
+        guild_id=gid,
+        user_id=uid,
+        scope=scope,
+        board_key=board_key,
+        quest_no=quest_no,
+        today_ymd=today,
+    )
+
+
+# 완료/미완료 체크형 의뢰의 진행 표시 (quest_type -> (완료, 미완료))
+_CHECK_PROGRESS = {
+    "explore_done": (" (진행: 탐사 완료)", " (진행: 탐사 필요)"),
+    "explore_sandstorm_success": (" (진행: 1/1)", " (진행: 0/1)"),
+}
+
+
+def _iter_quest_section(
+    quests: list[Any],
+    *,
+    offset: int,
+    claimed_set: set[int],
+    inv: Dict[str, int],
+    repaid: int,
+    checks: Dict[str, bool],
+) -> Iterator[str]:
+    """한 보드(일일/주간)의 의뢰 줄들. 미리 모은 값으로 포맷만 한다. (I/O 없음)"""
+
+    for q in quests:
+        qn, qtype, title, desc, target_key, target_qty, rpts, rcr, rit, riq = q
+        claimed = qn in claimed_set
+        tag = "완료" if claimed else " "
+
+        progress = ""
+        if not claimed:
+            if qtype == "deliver_item" and target_key:
+                have = int(inv.get(target_key, 0))
+                name = ITEM_NAME.get(target_key, target_key)
+                progress = f" (진행: {name} {_fmt(have)}/{_fmt(target_qty)})"
+            elif qtype == "repay_total":
+                progress = f" (진행: {_fmt(repaid)}/{_fmt(target_qty)})"
+            elif qtype in checks:
+                done_text, todo_text = _CHECK_PROGRESS[qtype]
+                progress = done_text if checks[qtype] else todo_text
+
+        reward = _reward_text(rpts, rcr, rit, riq)
+        yield f"{offset + qn}. [{tag}] **{title}** — {desc}{progress}\n   보상: {reward}"
+
+
+def _iter_board_lines(hon: str, today: str, week_key: str, data: Dict[str, Any]) -> Iterator[str]:
+    """!의뢰 본문을 한 줄씩 만든다. (호출부에서 join 한 번으로 합친다)"""
+
+    inv = data["inv"]
+
+    yield f"{hon} 의뢰 게시판이야."
+    yield f"- 일일: `{today}` / 주간: `{week_key}`"
+
+    yield "\n**[일일 의뢰]**"
+    yield from _iter_quest_section(
+        data["daily"],
+        offset=0,
+        claimed_set=data["daily_claimed"],
+        inv=inv,
+        repaid=int(data["day_repaid"]),
+        checks={"explore_done": bool(data["explore_done"])},
+    )
+
+    yield "\n**[주간 의뢰]**"
+    yield from _iter_quest_section(
+        data["weekly"],
+        offset=_WEEKLY_NO_OFFSET,
+        claimed_set=data["weekly_claimed"],
+        inv=inv,
+        repaid=int(data["week_repaid"]),
+        checks={"explore_sandstorm_success": bool(data["sandstorm_done"])},
+    )
+
+    yield "\n보상 받기: `!납품 <번호>`  /  랭킹: `!의뢰랭킹`"
+
+
 class AbyQuestBoardCog(commands.Cog):
     """Phase6-2 Phase5: 의뢰 게시판 + 주간 랭킹."""
 
@@ -87,95 +244,16 @@ class AbyQuestBoardCog(commands.Cog):
         today = _today_ymd_kst()
         week_key = week_key_from_ymd(today)
 
-        # ensure boards exist
-        try:
-            ensure_aby_daily_quest_board(gid, today)
-            ensure_aby_weekly_quest_board(gid, week_key)
-        except Exception as e:
-            logger.exception("ensure quest board failed: %s", e)
-            await send_ctx(ctx, f"{hon}… 게시판이 잠깐 고장난 것 같아. (DB 확인 필요)", allow_glitch=True)
-            return
-
-        daily = get_aby_quests(gid, "daily", today)
-        weekly = get_aby_quests(gid, "weekly", week_key)
-
-        inv = get_user_inventory(uid)
-
-        lines: list[str] = []
-        lines.append(f"{hon} 의뢰 게시판이야.")
-        lines.append(f"- 일일: `{today}` / 주간: `{week_key}`")
-
-        # Daily
-        lines.append("\n**[일일 의뢰]**")
-        for q in daily:
-            qn = int(q.get("quest_no") or 0)
-            shown = qn
-            qtype = str(q.get("quest_type") or "")
-            title = str(q.get("title") or "")
-            desc = str(q.get("description") or "")
-            target_key = str(q.get("target_key") or "")
-            target_qty = int(q.get("target_qty") or 0)
-            rpts = int(q.get("reward_points") or 0)
-            rcr = int(q.get("reward_credits") or 0)
-            rit = str(q.get("reward_item_key") or "")
-            riq = int(q.get("reward_item_qty") or 0)
-
-            claimed = is_aby_quest_claimed(gid, "daily", today, qn, uid)
-            tag = "완료" if claimed else " "
-
-            progress = ""
-            if not claimed:
-                if qtype == "deliver_item" and target_key:
-                    have = int(inv.get(target_key, 0))
-                    name = ITEM_NAME.get(target_key, target_key)
-                    progress = f" (진행: {name} {_fmt(have)}/{_fmt(target_qty)})"
-                elif qtype == "repay_total":
-                    repaid = repay_total_for_day(gid, uid, today)
-                    progress = f" (진행: {_fmt(repaid)}/{_fmt(target_qty)})"
-                elif qtype == "explore_done":
-                    meta = get_explore_meta(uid, today)
-                    progress = " (진행: 탐사 완료)" if meta else " (진행: 탐사 필요)"
-
-            reward = _reward_text(rpts, rcr, rit, riq)
-            lines.append(f"{shown}. [{tag}] **{title}** — {desc}{progress}\n   보상: {reward}")
-
-        # Weekly
-        lines.append("\n**[주간 의뢰]**")
-        for q in weekly:
-            qn = int(q.get("quest_no") or 0)
-            shown = ABY_DAILY_QUEST_COUNT + qn
-            qtype = str(q.get("quest_type") or "")
-            title = str(q.get("title") or "")
-            desc = str(q.get("description") or "")
-            target_key = str(q.get("target_key") or "")
-            target_qty = int(q.get("target_qty") or 0)
-            rpts = int(q.get("reward_points") or 0)
-            rcr = int(q.get("reward_credits") or 0)
-            rit = str(q.get("reward_item_key") or "")
-            riq = int(q.get("reward_item_qty") or 0)
-
-            claimed = is_aby_quest_claimed(gid, "weekly", week_key, qn, uid)
-            tag = "완료" if claimed else " "
-
-            progress = ""
-            if not claimed:
-                if qtype == "deliver_item" and target_key:
-                    have = int(inv.get(target_key, 0))
-                    name = ITEM_NAME.get(target_key, target_key)
-                    progress = f" (진행: {name} {_fmt(have)}/{_fmt(target_qty)})"
-                elif qtype == "repay_total":
-                    repaid = repay_total_for_week(gid, uid, week_key)
-                    progress = f" (진행: {_fmt(repaid)}/{_fmt(target_qty)})"
-                elif qtype == "explore_sandstorm_success":
-                    done = has_sandstorm_success_in_week(uid, week_key)
-                    progress = " (진행: 1/1)" if done else " (진행: 0/1)"
-
-            reward = _reward_text(rpts, rcr, rit, riq)
-            lines.append(f"{shown}. [{tag}] **{title}** — {desc}{progress}\n   보상: {reward}")
-
-        lines.append("\n보상 받기: `!납품 <번호>`  /  랭킹: `!의뢰랭킹`")
+        async with ctx.typing():
+            try:
+                data = await _collect_board_data(gid, uid, today, week_key)
+            except Exception as e:
+                logger.exception("ensure quest board failed: %s", e)
+                await send_ctx(ctx, f"{hon}… 게시판이 잠깐 고장난 것 같아. (DB 확인 필요)", allow_glitch=True)
+                return
 
-        await send_ctx(ctx, "\n".join(lines), allow_glitch=True)
+        body = "\n".join(_iter_board_lines(hon, today, week_key, data))
+        await send_ctx(ctx, body, allow_glitch=True)
 
     @commands.command(name="납품")
     async def quest_claim(self, ctx: commands.Context, num: Optional[str] = None):
@@ -184,14 +262,18 @@ class AbyQuestBoardCog(commands.Cog):
             return
 
         hon = get_honorific(ctx.author, ctx.guild)
-        if not num or not str(num).strip().isdigit():
+        raw = str(num or "").strip()
+        if not raw.isdecimal():
             await send_ctx(ctx, f"{hon} 납품 번호를 알려줘. 예: `!납품 1`", allow_glitch=True)
             return
 
-        n = int(str(num).strip())
+        n = int(raw)
         if n <= 0:
             await send_ctx(ctx, f"{hon}… 그 번호는 좀 이상해. (1 이상)", allow_glitch=True)
             return
+        if n > _BOARD_NO_MAX:
+            await send_ctx(ctx, f"{hon}… 그 번호는 게시판에 없어. `!의뢰`로 확인해줘.", allow_glitch=True)
+            return
 
         gid = int(ctx.guild.id)
         uid = int(ctx.author.id)
@@ -199,35 +281,23 @@ class AbyQuestBoardCog(commands.Cog):
         today = _today_ymd_kst()
         week_key = week_key_from_ymd(today)
 
-        # ensure boards exist
-        ensure_aby_daily_quest_board(gid, today)
-        ensure_aby_weekly_quest_board(gid, week_key)
-
-        if 1 <= n <= ABY_DAILY_QUEST_COUNT:
+        if n <= _WEEKLY_NO_OFFSET:
             scope = "daily"
             board_key = today
             quest_no = n
-        elif ABY_DAILY_QUEST_COUNT < n <= (ABY_DAILY_QUEST_COUNT + ABY_WEEKLY_QUEST_COUNT):
+        else:
             scope = "weekly"
             board_key = week_key
-            quest_no = n - ABY_DAILY_QUEST_COUNT
-        else:
-            await send_ctx(ctx, f"{hon}… 그 번호는 게시판에 없어. `!의뢰`로 확인해줘.", allow_glitch=True)
-            return
-
-        try:
-            res = claim_aby_quest(
-                guild_id=gid,
-                user_id=uid,
-                scope=scope,
-                board_key=board_key,
-                quest_no=quest_no,
-                today_ymd=today,
-            )
-        except Exception as e:
-            logger.exception("claim quest failed: %s", e)
-            await send_ctx(ctx, f"{hon}… 납품 처리 중에 뭔가 꼬였어. (DB 확인 필요)", allow_glitch=True)
-            return
+            quest_no = n - _WEEKLY_NO_OFFSET
+
+        async with ctx.typing():
+            try:
+                # ensure boards exist + claim (DB 작업은 이벤트 루프 밖에서)
+                res = await asyncio.to_thread(_ensure_and_claim, gid, uid, scope, board_key, quest_no, today, week_key)
+            except Exception as e:
+                logger.exception("claim quest failed: %s", e)
+                await send_ctx(ctx, f"{hon}… 납품 처리 중에 뭔가 꼬였어. (DB 확인 필요)", allow_glitch=True)
+                return
 
         if not res.get("ok"):
             reason = str(res.get("reason") or "")
@@ -259,7 +329,7 @@ class AbyQuestBoardCog(commands.Cog):
         wk = str(res.get("week_key") or week_key)
 
         reward = _reward_text(pts, cr, itk, itq)
-        my_pts = get_user_weekly_points(gid, wk, uid)
+        my_pts = await asyncio.to_thread(get_user_weekly_points, gid, wk, uid)
 
         await send_ctx(
             ctx,
@@ -280,8 +350,10 @@ class AbyQuestBoardCog(commands.Cog):
         today = _today_ymd_kst()
         week_key = week_key_from_ymd(today)
 
-        rows = get_weekly_points_ranking(gid, week_key, limit=10)
-        my_pts = get_user_weekly_points(gid, week_key, uid)
+        rows, my_pts = await asyncio.gather(
+            asyncio.to_thread(get_weekly_points_ranking, gid, week_key, 10),
+            asyncio.to_thread(get_user_weekly_points, gid, week_key, uid),
+        )
 
         if not rows:
             await send_ctx(ctx, f"{hon} 이번 주 의뢰 점수… 아직 아무도 없어. 첫 타자 해볼래?", allow_glitch=True)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import re
 from typing import Optional
@@ -20,8 +22,6 @@ logger = logging.getLogger(__name__)
 # Phase6-2 Phase4: 공방(제작/판매)
 # - 탐사로 얻는 재료(고철/천조각/필터/배터리/회로기판)로 아이템을 제작하거나 판매할 수 있어요.
 
-MATERIAL_KEYS = {"scrap", "cloth", "filter", "battery", "circuit"}
-
 ITEM_NAMES = {
     "mask": "방진마스크",
     "drone": "탐사용 드론",
@@ -71,6 +71,9 @@ SELL_PRICES = {
     "circuit": 1800,
 }
 
+# 판매 가능한 재료 = 판매가가 있는 아이템 (두 표가 어긋나지 않게 SELL_PRICES에서 만든다)
+MATERIAL_KEYS = frozenset(SELL_PRICES)
+
 RECIPES = {
     "mask": {
         "name": "방진마스크",
@@ -96,6 +99,10 @@ RECIPES = {
 }
 
 
+_WS_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def _fmt(n: int) -> str:
     try:
         return f"{int(n):,}"
@@ -103,31 +110,60 @@ def _fmt(n: int) -> str:
         return str(n)
 
 
+# 표시 이름(공백 제거/소문자) -> key. 이름 기반 fallback을 dict 조회 한 번으로 끝낸다.
+_NORMALIZED_NAME_TO_KEY = {_WS_RE.sub("", name).lower(): k for k, name in ITEM_NAMES.items()}
+
+
+@functools.lru_cache(maxsize=256)
 def _resolve_item_key(raw: str) -> Optional[str]:
-    s = re.sub(r"\s+", "", (raw or "")).lower()
+    s = _WS_RE.sub("", (raw or "")).lower()
     if not s:
         return None
     if s in ITEM_ALIASES:
         return ITEM_ALIASES[s]
     # try by display name
-    for k, name in ITEM_NAMES.items():
-        if s == re.sub(r"\s+", "", name).lower():
-            return k
-    return None
+    return _NORMALIZED_NAME_TO_KEY.get(s)
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_qty(token: str) -> Optional[int]:
     t = (token or "").strip().lower()
     if not t:
         return None
     if t in {"all", "전체", "전부", "올인"}:
         return -1
-    if re.fullmatch(r"\d+", t):
+    if _DIGITS_RE.fullmatch(t):
         v = int(t)
         return v if v > 0 else None
     return None
 
 
+def _build_workshop_body() -> str:
+    lines: list[str] = [
+        "- 제작: `!제작 <아이템>`",
+        "- 판매: `!판매 <재료> [수량|전체]`",
+        "- 보유 확인: `!가방`",
+        "",
+        "**제작 레시피**",
+    ]
+
+    for r in RECIPES.values():
+        req = r["req"]
+        req_txt = ", ".join([f"{ITEM_NAMES.get(k, k)} x{v}" for k, v in req.items()])
+        lines.append(f"- {r['name']} ({_fmt(r['cost'])}크레딧) :: {req_txt}")
+        lines.append(f"  └ {r['desc']}")
+
+    lines.append("\n**재료 판매가(1개당)**")
+    for k, p in SELL_PRICES.items():
+        lines.append(f"- {ITEM_NAMES.get(k, k)}: {_fmt(p)} 크레딧")
+
+    return "\n".join(lines)
+
+
+# !공방: 호칭 줄 뒤에 붙는 안내 본문 (상수라 import 때 한 번만 만든다)
+_WORKSHOP_BODY = _build_workshop_body()
+
+
 class AbyWorkshopCog(commands.Cog):
     """Abydos 공방 (Phase6-2 Phase4)"""
 
@@ -138,26 +174,7 @@ class AbyWorkshopCog(commands.Cog):
     async def workshop_info(self, ctx: commands.Context):
         hon = get_honorific(ctx.author, ctx.guild)
 
-        lines: list[str] = [
-            f"{hon} 공방 열었어.",
-            "- 제작: `!제작 <아이템>`",
-            "- 판매: `!판매 <재료> [수량|전체]`",
-            "- 보유 확인: `!가방`",
-            "",
-            "**제작 레시피**",
-        ]
-
-        for key, r in RECIPES.items():
-            req = r["req"]
-            req_txt = ", ".join([f"{ITEM_NAMES.get(k, k)} x{v}" for k, v in req.items()])
-            lines.append(f"- {r['name']} ({_fmt(r['cost'])}크레딧) :: {req_txt}")
-            lines.append(f"  └ {r['desc']}")
-
-        lines.append("\n**재료 판매가(1개당)**")
-        for k, p in SELL_PRICES.items():
-            lines.append(f"- {ITEM_NAMES.get(k, k)}: {_fmt(p)} 크레딧")
-
-        await send_ctx(ctx, "\n".join(lines), allow_glitch=True)
+        await send_ctx(ctx, f"{hon} 공방 열었어.\n" + _WORKSHOP_BODY, allow_glitch=True)
 
     @commands.command(name="제작")
     async def craft(self, ctx: commands.Context, *, item_name: str = ""):
@@ -174,7 +191,8 @@ class AbyWorkshopCog(commands.Cog):
 
         r = RECIPES[key]
         memo = f"craft:{key}"
-        res = craft_user_items(
+        res = await asyncio.to_thread(
+            craft_user_items,
             ctx.author.id,
             cost_credits=int(r["cost"]),
             req_items=dict(r["req"]),
@@ -218,12 +236,13 @@ class AbyWorkshopCog(commands.Cog):
                 item_part = " ".join(parts[:-1])
 
         key = _resolve_item_key(item_part)
-        if key not in MATERIAL_KEYS or key not in SELL_PRICES:
+        if key not in MATERIAL_KEYS:
             await send_ctx(ctx, f"{hon} 그건 판매 가능한 '재료'가 아니야. `!공방`에서 판매 목록 확인해줘.", allow_glitch=True)
             return
 
         price = int(SELL_PRICES[key])
-        res = sell_user_item(
+        res = await asyncio.to_thread(
+            sell_user_item,
             ctx.author.id,
             item_key=key,
             qty=qty,
@@ -234,7 +253,7 @@ class AbyWorkshopCog(commands.Cog):
         if not res.get("ok"):
             reason = str(res.get("reason") or "")
             if reason in {"no_item", "qty"}:
-                inv = get_user_inventory(ctx.author.id)
+                inv = await asyncio.to_thread(get_user_inventory, ctx.author.id)
                 have = int(inv.get(key) or 0)
                 await send_ctx(ctx, f"{hon} 그 재료가 부족해. (보유 {ITEM_NAMES.get(key, key)} x{have})", allow_glitch=True)
                 return
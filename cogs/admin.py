@@ -1,5 +1,6 @@
 
 import datetime
+import logging
 
 import discord
 from discord.ext import commands
@@ -8,11 +9,20 @@ from discord import app_commands
 from yume_store import get_world_state
 from yume_websync import post_sync_payload
 from yume_presence import apply_random_presence
+from yume_runtime import BackgroundTasks
+
+logger = logging.getLogger(__name__)
 
 OWNER_ID = 1433962010785349634
 
 KST = datetime.timezone(datetime.timedelta(hours=9))
 
+# Embeds are built in one shot via Embed.from_dict (raw int colour).
+_COLOR_BLURPLE = discord.Color.blurple().value
+
+# !청소: 이 개수(명령 메시지 포함) 이하면 bulk delete 대신 하나씩 지운다.
+_SINGLE_DELETE_MAX = 3
+
 
 def _fmt_kst(ts: int) -> str:
     if not ts:
@@ -26,6 +36,10 @@ class AdminCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._bg = BackgroundTasks("AdminCog")
+
+    def cog_unload(self) -> None:
+        self._bg.cancel_all()
 
     def _core(self):
         """
@@ -79,27 +93,15 @@ class AdminCog(commands.Cog):
 
         name = getattr(ctx.author, "display_name", "누구야")
 
-        embed = discord.Embed(
-            title="유메 상태 리포트… 같은 거.",
-            description=f"{name} 기준으로 정리해봤어.",
-            color=discord.Color.blurple(),
-        )
-
-        embed.add_field(
-            name="기분(mood)",
-            value=f"`{mood:+.2f}`",
-            inline=False,
-        )
-        embed.add_field(
-            name="짜증(irritation)",
-            value=f"`{irritation:+.2f}`",
-            inline=False,
-        )
-        embed.add_field(
-            name=f"{name}에 대한 호감도(affection)",
-            value=f"`{affection:+.1f}` (stage: `{stage}`)",
-            inline=False,
-        )
+        fields = [
+            {"name": "기분(mood)", "value": f"`{mood:+.2f}`", "inline": False},
+            {"name": "짜증(irritation)", "value": f"`{irritation:+.2f}`", "inline": False},
+            {
+                "name": f"{name}에 대한 호감도(affection)",
+                "value": f"`{affection:+.1f}` (stage: `{stage}`)",
+                "inline": False,
+            },
+        ]
 
         # Phase0: show virtual world state (weather) for debugging.
         try:
@@ -107,18 +109,28 @@ class AdminCog(commands.Cog):
             w = str(world.get("weather") or "clear")
             changed_at = int(world.get("weather_changed_at") or 0)
             next_at = int(world.get("weather_next_change_at") or 0)
-            embed.add_field(
-                name="아비도스 환경(가상 날씨)",
-                value=(
-                    f"weather: `{w}`\n"
-                    f"changed_at(KST): `{_fmt_kst(changed_at)}`\n"
-                    f"next_change_at(KST): `{_fmt_kst(next_at)}`"
-                ),
-                inline=False,
+            fields.append(
+                {
+                    "name": "아비도스 환경(가상 날씨)",
+                    "value": (
+                        f"weather: `{w}`\n"
+                        f"changed_at(KST): `{_fmt_kst(changed_at)}`\n"
+                        f"next_change_at(KST): `{_fmt_kst(next_at)}`"
+                    ),
+                    "inline": False,
+                }
             )
         except Exception:
             pass
 
+        embed = discord.Embed.from_dict(
+            {
+                "title": "유메 상태 리포트… 같은 거.",
+                "description": f"{name} 기준으로 정리해봤어.",
+                "color": _COLOR_BLURPLE,
+                "fields": fields,
+            }
+        )
         await ctx.send(embed=embed)
 
 
@@ -154,14 +166,56 @@ class AdminCog(commands.Cog):
             )
             return
 
-        amount = max(1, min(100, amount))
-
-        deleted = await ctx.channel.purge(limit=amount + 1)
-        count = max(0, len(deleted) - 1)
+        if amount < 1 or amount > 100:
+            await ctx.send("한 번에 1~100개까지만 치울 수 있어.", delete_after=5)
+            return
 
-        msg = await ctx.send(f"{count}개 정도… 정리해 뒀어.")
-        await msg.delete(delay=5)
+        # 응답은 바로 하고, 실제 삭제(REST 여러 번)는 백그라운드에서 진행한다.
+        ack = await ctx.send("정리 중…")
+        self._bg.spawn(self._do_clean(ctx.channel, ack, amount))
 
+    async def _do_clean(
+        self, channel: discord.TextChannel | discord.Thread, ack: discord.Message, amount: int
+    ) -> None:
+        # 도중에 실패해도 "정리 중…" 안내가 남지 않게, 결과 문구로 바꾼 뒤 지운다.
+        content = "정리하다가 뭔가 꼬였어… 잠시 뒤에 다시 해줘."
+        try:
+            # ack보다 앞선 메시지만 대상 (명령 메시지 + amount개)
+            msgs = [m async for m in channel.history(limit=amount + 1, before=ack)]
+            done = 0
+            if len(msgs) <= _SINGLE_DELETE_MAX:
+                # 몇 개 안 되면 개별 DELETE가 bulk delete보다 싸고, 14일 제한도 없다.
+                for m in msgs:
+                    try:
+                        await m.delete()
+                        done += 1
+                    except discord.NotFound:
+                        pass
+            else:
+                # 최근 메시지면 가져온 목록 그대로 bulk delete로 끝낸다.
+                # (14일 넘은 메시지가 섞였거나 bulk delete가 거절되면 purge로 폴백)
+                cutoff = discord.utils.utcnow() - datetime.timedelta(days=14) + datetime.timedelta(minutes=1)
+                if all(m.created_at > cutoff for m in msgs):
+                    try:
+                        for i in range(0, len(msgs), 100):
+                            chunk = msgs[i:i + 100]
+                            await channel.delete_messages(chunk)
+                            done += len(chunk)
+                    except discord.HTTPException:
+                        pass
+                if done < len(msgs):
+                    done += len(await channel.purge(limit=len(msgs) - done, before=ack))
+            content = f"{max(0, done - 1)}개 정도… 정리해 뒀어."
+        except discord.Forbidden:
+            content = "여기 메시지를 지울 권한이 없나 봐… (메시지 관리 권한 확인 필요)"
+        except Exception as e:
+            logger.exception("clean messages failed: %s", e)
+        finally:
+            try:
+                await ack.edit(content=content)
+            except discord.HTTPException:
+                pass
+            await ack.delete(delay=5)
 
 
     @commands.command(name="아비동기화")
@@ -188,28 +242,34 @@ class AdminCog(commands.Cog):
         channel="메시지를 보낼 텍스트 채널을 선택해줘.",
         content="유메가 대신 보낼 메시지 내용을 적어줘.",
     )
+    # 권한 없는 사람에겐 Discord가 명령 자체를 숨긴다. (서버 설정 > 연동에서 조정 가능)
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.guild_only()
     async def yume_deliver(
         self,
         interaction: discord.Interaction,
         channel: discord.TextChannel,
         content: str,
     ):
+        # channel.send가 느려도 3초 응답 제한에 걸리지 않게 먼저 defer 해 둔다.
+        await interaction.response.defer(ephemeral=True)
+
         try:
             await channel.send(content)
         except discord.Forbidden:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{channel.mention} 에는 말을 걸 권한이 없어.",
                 ephemeral=True,
             )
             return
         except Exception:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "메시지를 보내는 중에, 알 수 없는 오류가 났어.",
                 ephemeral=True,
             )
             return
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"✅ {channel.mention} (`{channel.id}`) 로 전달해 뒀어.",
             ephemeral=True,
         )
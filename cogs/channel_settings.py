@@ -6,9 +6,10 @@ from typing import Optional, Tuple
 import discord
 from discord.ext import commands
 
-from yume_send import send_ctx
+from yume_send import NO_MENTIONS, send_ctx
 from yume_store import get_config, set_config
 
+
 # 표시 이름 -> (bot_config key, 설명)
 FEATURES: dict[str, Tuple[str, str]] = {
     "교칙": ("rule_channel_id", "매일 교칙 공지/강제교칙 출력 채널"),
@@ -153,7 +154,7 @@ class ChannelSettingsCog(commands.Cog):
                             f"✅ (테스트) **{disp}** 채널이 여기로 설정돼 있어.\n"
                             f"- 설정자: {ctx.author.mention}\n"
                             f"- 명령: `!채널지정 test all`",
-                            allowed_mentions=discord.AllowedMentions.none(),
+                            allowed_mentions=NO_MENTIONS,
                         )
                         results.append((disp, True, "전송 성공", cid))
                     except discord.Forbidden:
@@ -199,7 +200,7 @@ class ChannelSettingsCog(commands.Cog):
                     f"✅ (테스트) **{feature}** 채널이 여기로 설정돼 있어.\n"
                     f"- 설정자: {ctx.author.mention}\n"
                     f"- 명령: `!채널지정 test {feature}`",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    allowed_mentions=NO_MENTIONS,
                 )
                 await send_ctx(ctx, f"완료! <#{cid}> 로 테스트 메시지를 보냈어.")
             except discord.Forbidden:
@@ -242,7 +243,7 @@ class ChannelSettingsCog(commands.Cog):
                             f"✅ (테스트) **{disp}** 채널이 여기로 설정돼 있어.\n"
                             f"- 설정자: {ctx.author.mention}\n"
                             f"- 명령: `!채널지정 test all`",
-                            allowed_mentions=discord.AllowedMentions.none(),
+                            allowed_mentions=NO_MENTIONS,
                         )
                         results.append((disp, True, "전송 성공", cid))
                     except discord.Forbidden:
@@ -304,7 +305,7 @@ class ChannelSettingsCog(commands.Cog):
                             f"✅ (테스트) **{disp}** 채널이 여기로 설정돼 있어.\n"
                             f"- 설정자: {ctx.author.mention}\n"
                             f"- 명령: `!채널지정 test all`",
-                            allowed_mentions=discord.AllowedMentions.none(),
+                            allowed_mentions=NO_MENTIONS,
                         )
                         results.append((disp, True, "전송 성공", cid))
                     except discord.Forbidden:
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 import discord
 from discord.ext import commands
 
+from yume_send import NO_MENTIONS
 from yume_store import (
     add_user_xp,
     get_guild_xp_config,
@@ -691,7 +692,7 @@ class LevelingCog(commands.Cog):
         # short summary
         await ctx.send(
             f"경험치: {'ON' if enabled else 'OFF'} | 채팅 {cfg.get('chat_xp_min')}-{cfg.get('chat_xp_max')} | 커맨드 기본 {cfg.get('cmd_xp')} | 레벨업알림 {ann_s}",
-            allowed_mentions=discord.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
         )
 
     @commands.command(name="경험치세부")
@@ -712,7 +713,7 @@ class LevelingCog(commands.Cog):
             f"상호작용: component={cfg.get('interaction_xp_component', 2)} | modal={cfg.get('interaction_xp_modal', 3)}\n"
             f"레벨업: style={cfg.get('announce_style', 'banner')} | ping={cfg.get('announce_ping', 1)} | 채널={ann_s}"
         )
-        await ctx.send(msg, allowed_mentions=discord.AllowedMentions.none())
+        await ctx.send(msg, allowed_mentions=NO_MENTIONS)
 
     @commands.command(name="경험치설정")
     async def xp_set_command(self, ctx: commands.Context, key: Optional[str] = None, *values: str):
@@ -887,7 +888,7 @@ class LevelingCog(commands.Cog):
             await ctx.send(
                 f"레벨업 알림 채널: {ann_s}\n"
                 f"설정: `!경험치채널 here` 또는 `!경험치채널 #채널` / 해제: `!경험치채널 off`",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             return
 
@@ -630,8 +630,9 @@ class ReactionsCog(commands.Cog):
         if message.author.bot:
             return
 
-        lowered = message.content.lower()
-        if "육포" in lowered or "육포 " in lowered:
+        content = message.content
+        # "육포"는 대소문자가 없는 한글이라 lower() 사본 없이 원문에서 바로 찾는다.
+        if "육포" in content:
             self._block_yukpo(message.author.id, minutes=5)
             try:
                 await message.channel.send(
@@ -642,11 +643,11 @@ class ReactionsCog(commands.Cog):
                 pass
             return
 
-        if self.bot.user and self.bot.user.mention in message.content:
+        if self.bot.user and self.bot.user.mention in content:
             # 프리토킹 채널(YumeChatCog)이 켜진 곳에서는 중복 응답을 막는다.
             try:
-                active = getattr(self.bot, "yume_chat_active_channels", set())
-                if message.channel.id in set(active):
+                active = getattr(self.bot, "yume_chat_active_channels", ())
+                if message.channel.id in active:
                     return
             except Exception:
                 pass
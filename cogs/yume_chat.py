@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, FrozenSet, List, Tuple, Optional, Set
 
 import discord
 from discord.ext import commands
@@ -16,10 +16,11 @@ from yume_stamps import maybe_award_stamp_message
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_CHAT_CHANNEL_IDS: Set[int] = {
+# 기본 프리토킹 채널 (불변: 런타임에 켜고 끄는 건 self.active_channels 사본에서)
+DEFAULT_CHAT_CHANNEL_IDS: FrozenSet[int] = frozenset({
     1438804132613066833,
     1445664712133181513,
-}
+})
 
 DEV_USER_ID = 1433962010785349634
 
@@ -16,6 +16,7 @@ from discord.ext import commands
 from yume_brain import YumeBrain
 from yume_honorific import get_honorific
 from yume_prompt import YUME_ROLE_PROMPT_KR
+from yume_send import NO_MENTIONS
 
 logger = logging.getLogger(__name__)
 
@@ -492,7 +493,7 @@ class YumeFunCog(commands.Cog):
             else:
                 reply = reply[:1900]
 
-        await ctx.send(reply, allowed_mentions=discord.AllowedMentions.none())
+        await ctx.send(reply, allowed_mentions=NO_MENTIONS)
 
 
     @commands.command(name="호시노", aliases=["1학년"])
@@ -529,7 +530,7 @@ class YumeFunCog(commands.Cog):
             obs = "호시노 쨩이… 어디선가… 힘내고 있어…!"
             yline = "유메는… 몰래 응원 중이야… 으헤~ 💙"
             reply = f"📓 [시간] {clock} | [관찰 내용] {obs}\n💬 [유메의 한마디] {yline}"
-            await ctx.send(_sanitize_mentions(reply), allowed_mentions=discord.AllowedMentions.none())
+            await ctx.send(_sanitize_mentions(reply), allowed_mentions=NO_MENTIONS)
             return
 
         # 같은 채널에서 연속 호출 시 같은 문구 반복을 최대한 피하기
@@ -583,6 +584,6 @@ class YumeFunCog(commands.Cog):
         except Exception:
             pass
 
-        await ctx.send(reply, allowed_mentions=discord.AllowedMentions.none())
+        await ctx.send(reply, allowed_mentions=NO_MENTIONS)
 async def setup(bot: commands.Bot):
     await bot.add_cog(YumeFunCog(bot))
\ No newline at end of file
@@ -107,7 +107,7 @@ _load_env_from_dotenv()
 
 from yume_ai import setup_yume_ai  # type: ignore
 from yume_db import init_db  # type: ignore
-from yume_runtime import start_background_tasks  # type: ignore
+from yume_runtime import start_background_tasks, stop_background_tasks  # type: ignore
 
 
 intents = discord.Intents.default()
@@ -362,6 +362,8 @@ async def main():
         except asyncio.CancelledError:
             logger.info("CancelledError로 종료합니다.")
             return
+        finally:
+            await stop_background_tasks(bot)
 
 
 if __name__ == "__main__":
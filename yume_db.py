@@ -5,7 +5,9 @@ SQLite helper for YumeBot.
 Design goals
 - Boring and predictable.
 - Single file DB at config.YUME_DB_FILE.
-- Safe with asyncio (opens a new connection per operation).
+- Safe with asyncio: each helper call opens its own short-lived connection,
+  except inside transaction(), where helpers on the same thread share the
+  transaction's connection (see _ACTIVE_TX).
 - Light migrations only (additive tables/columns).
 
 Schema versions
@@ -22,11 +24,14 @@ v9: guild leveling (XP/Level)
 
 from __future__ import annotations
 
+import itertools
 import os
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
 
 from config import YUME_DB_FILE
 
@@ -48,8 +53,50 @@ def _connect() -> sqlite3.Connection:
     return con
 
 
+class _ActiveTx(NamedTuple):
+    con: sqlite3.Connection
+    thread_id: int
+    after_commit: List[Callable[[], None]]
+
+
+# Transaction currently open in this context (if any). While set, helpers on
+# the owning thread reuse its connection instead of opening their own.
+# asyncio.to_thread() copies the context into the worker thread, so the
+# thread id is checked too: code offloaded from inside a transaction does not
+# see it and gets its own connection (reads see committed data only, writes
+# wait for the outer transaction's lock).
+_ACTIVE_TX: ContextVar[Optional[_ActiveTx]] = ContextVar("yume_db_active_tx", default=None)
+_SAVEPOINT_IDS = itertools.count(1)
+
+
+def _active_tx() -> Optional[_ActiveTx]:
+    tx = _ACTIVE_TX.get()
+    if tx is not None and tx.thread_id == threading.get_ident():
+        return tx
+    return None
+
+
+def after_commit(fn: Callable[[], None]) -> None:
+    """Run `fn` once the outermost transaction commits (right away if none).
+
+    Used for in-process caches: a callback queued inside a transaction or
+    savepoint that rolls back is dropped, so caches never see rolled-back rows.
+    """
+
+    tx = _active_tx()
+    if tx is None:
+        fn()
+    else:
+        tx.after_commit.append(fn)
+
+
 @contextmanager
 def connect() -> Iterator[sqlite3.Connection]:
+    tx = _active_tx()
+    if tx is not None:
+        yield tx.con
+        return
+
     con = _connect()
     try:
         yield con
@@ -61,17 +108,46 @@ def connect() -> Iterator[sqlite3.Connection]:
 
 
 @contextmanager
-def transaction() -> Iterator[sqlite3.Connection]:
-    """BEGIN IMMEDIATE transaction to avoid writer starvation."""
+def transaction(*, immediate: bool = True) -> Iterator[sqlite3.Connection]:
+    """BEGIN IMMEDIATE transaction to avoid writer starvation.
+
+    immediate=False opens a DEFERRED transaction instead, for read-only
+    snapshots that should not take the write lock (ignored when nested).
+
+    Nested calls share the outer connection and run as a SAVEPOINT, so a
+    batch of helpers commits once and a failing step only rolls back itself.
+    after_commit() callbacks run only after the outermost COMMIT.
+    """
 
+    tx = _active_tx()
+    if tx is not None:
+        sp = f"sp_{next(_SAVEPOINT_IDS)}"
+        mark = len(tx.after_commit)
+        tx.con.execute(f"SAVEPOINT {sp};")
+        try:
+            yield tx.con
+            tx.con.execute(f"RELEASE {sp};")
+        except Exception:
+            tx.con.execute(f"ROLLBACK TO {sp};")
+            tx.con.execute(f"RELEASE {sp};")
+            del tx.after_commit[mark:]
+            raise
+        return
+
+    pending: List[Callable[[], None]] = []
     with connect() as con:
-        con.execute("BEGIN IMMEDIATE;")
+        con.execute("BEGIN IMMEDIATE;" if immediate else "BEGIN DEFERRED;")
+        token = _ACTIVE_TX.set(_ActiveTx(con, threading.get_ident(), pending))
         try:
             yield con
             con.execute("COMMIT;")
         except Exception:
             con.execute("ROLLBACK;")
             raise
+        finally:
+            _ACTIVE_TX.reset(token)
+    for fn in pending:
+        fn()
 
 
 def execute(sql: str, params: Sequence[Any] = ()) -> int:
@@ -110,7 +186,7 @@ def init_db() -> None:
 
     now = int(time.time())
 
-    SCHEMA_VERSION = 10
+    SCHEMA_VERSION = 11
 
     with transaction() as con:
         con.execute(
@@ -549,6 +625,13 @@ def init_db() -> None:
             _add_column("guild_xp_config", "announce_style TEXT NOT NULL DEFAULT 'banner'")
             _add_column("guild_xp_config", "announce_ping INTEGER NOT NULL DEFAULT 1")
 
+        # ===== v11 =====
+        if current_version < 11:
+            # Debt loop: "who still needs today's interest" is filtered in SQL.
+            con.execute(
+                "CREATE INDEX IF NOT EXISTS idx_aby_guild_debt_interest_ymd ON aby_guild_debt(last_interest_ymd);"
+            )
+
         con.execute(
             """
             INSERT INTO schema_meta(key, value, updated_at)
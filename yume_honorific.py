@@ -37,10 +37,11 @@ def get_honorific(user: discord.abc.User, guild: Optional[discord.Guild] = None)
         member = guild.get_member(user.id)
 
     if member is not None:
+        # Member.get_role() bisects the member's sorted role ids instead of
+        # materializing member.roles (a sorted list of Role objects) per call.
         try:
-            for r in member.roles:
-                if int(getattr(r, "id", 0)) == JUNIOR_ROLE_ID:
-                    return "후배"
+            if member.get_role(JUNIOR_ROLE_ID) is not None:
+                return "후배"
         except Exception:
             pass
 
@@ -22,14 +22,14 @@ import os
 import random
 import time
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Coroutine, List, Optional, Set
 
 import discord
 
 from yume_llm import generate_daily_rule
 from yume_send import send_channel
 from yume_presence import apply_random_presence, get_next_presence_interval_seconds
-from yume_websync import post_sync_payload, websync_enabled
+from yume_websync import close_http_session, post_sync_payload, websync_enabled
 from yume_store import (
     bump_daily_rule_attempt,
     ensure_daily_rule_row,
@@ -58,6 +58,32 @@ WEATHER_LABEL = {
 KST = timezone(timedelta(hours=9))
 
 
+class BackgroundTasks:
+    """Fire-and-forget task set for cogs: keeps a strong ref and logs failures."""
+
+    def __init__(self, owner: str):
+        self._owner = owner
+        self._tasks: Set[asyncio.Task] = set()
+
+    def spawn(self, coro: Coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        return task
+
+    def cancel_all(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("%s: background task failed", self._owner, exc_info=exc)
+
+
 def _now_kst() -> datetime:
     return datetime.now(tz=KST)
 
@@ -418,9 +444,7 @@ def start_background_tasks(bot: discord.Client) -> None:
 
 
 async def stop_background_tasks(bot: discord.Client) -> None:
-    tasks: Optional[List[asyncio.Task]] = getattr(bot, "_yume_bg_tasks", None)
-    if not tasks:
-        return
+    tasks: Optional[List[asyncio.Task]] = getattr(bot, "_yume_bg_tasks", None) or []
 
     for t in tasks:
         t.cancel()
@@ -433,4 +457,7 @@ async def stop_background_tasks(bot: discord.Client) -> None:
         except Exception:
             pass
 
-    bot._yume_bg_tasks = []  # type: ignore[attr-defined]
\ No newline at end of file
+    bot._yume_bg_tasks = []  # type: ignore[attr-defined]
+
+    # 웹 동기화 루프가 쓰던 aiohttp 세션도 같이 닫는다 (Unclosed client session 경고 방지).
+    await close_http_session()
\ No newline at end of file
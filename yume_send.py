@@ -15,6 +15,8 @@ Important:
 from __future__ import annotations
 
 import asyncio
+import datetime
+import functools
 import os
 import random
 from typing import Optional
@@ -26,6 +28,21 @@ from yume_effects import apply_glitch, chunk_for_discord, split_for_radio
 from yume_store import get_user_settings, get_world_state
 
 
+# Shared "ping nobody" preset; cogs import this instead of building one per send.
+NO_MENTIONS = discord.AllowedMentions.none()
+
+_KST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+@functools.lru_cache(maxsize=1024)
+def fmt_kst(ts: int) -> str:
+    """`MM/DD HH:MM` in KST ("-" for 0/None)."""
+    if not ts:
+        return "-"
+    dt = datetime.datetime.fromtimestamp(int(ts), tz=_KST)
+    return dt.strftime("%m/%d %H:%M")
+
+
 def _env_float(key: str, default: float) -> float:
     try:
         return float(os.getenv(key, str(default)).strip())
@@ -10,18 +10,21 @@ Phases
 
 We keep this module intentionally tiny and boring:
 - no ORM
-- no globals
+- no globals (except a few small read caches: bot_config, world_state, inventory, quest boards)
 - functions are simple and grep-friendly
 """
 
 from __future__ import annotations
 
+import functools
 import random
+import itertools
 import re
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, Tuple
 
-from yume_db import execute, fetchone, fetchall, transaction
+from yume_db import after_commit, execute, fetchone, fetchall, transaction
 
 
 def now_ts() -> int:
@@ -40,16 +43,36 @@ def get_con():
     return transaction()
 
 
+def with_transaction():
+    """Group several store calls into a single commit.
+
+    Helpers called inside reuse the same connection; their own
+    transaction() blocks become savepoints.
+    """
+
+    return transaction()
+
+
 # =========================
 # Generic bot config
 # =========================
 
 
+# Read-through cache for bot_config (key -> stored value, "" when missing).
+# Every write goes through set_config(), so the cache stays in sync within
+# this process; background loops poll per-guild keys every few minutes.
+# Cache writes go through after_commit() so a rolled-back transaction never
+# leaves its values behind.
+_CONFIG_CACHE: Dict[str, str] = {}
+
+
 def get_config(key: str, default: str | None = None) -> str | None:
-    row = fetchone("SELECT value FROM bot_config WHERE key=?;", (str(key),))
-    if not row:
-        return default
-    v = str(row.get("value") or "")
+    k = str(key)
+    v = _CONFIG_CACHE.get(k)
+    if v is None:
+        row = fetchone("SELECT value FROM bot_config WHERE key=?;", (k,))
+        v = str((row or {}).get("value") or "")
+        after_commit(functools.partial(_CONFIG_CACHE.__setitem__, k, v))
     return v if v != "" else default
 
 
@@ -63,6 +86,16 @@ def set_config(key: str, value: str) -> None:
         """,
         (str(key), str(value), now),
     )
+    after_commit(functools.partial(_CONFIG_CACHE.__setitem__, str(key), str(value)))
+
+
+def load_all_aby_configs() -> int:
+    """Warm the config cache with every `aby_*` key in one query."""
+
+    rows = fetchall("SELECT key, value FROM bot_config WHERE key LIKE 'aby\\_%' ESCAPE '\\';")
+    for r in rows or []:
+        _CONFIG_CACHE[str(r.get("key"))] = str(r.get("value") or "")
+    return len(rows or [])
 
 
 # =========================
@@ -239,7 +272,22 @@ def add_stamp_reward(
 # =========================
 
 
+# Read cache for the single world_state row: (valid_until unix ts, row).
+# The row only changes at weather_next_change_at or through
+# set_world_weather(), which clears it; the cap bounds staleness if the
+# stored schedule is bogus (see ensure_world_weather_rotated).
+_WORLD_STATE_CACHE_MAX_SEC = 300
+_WORLD_STATE_CACHE: Optional[Tuple[int, Dict[str, Any]]] = None
+
+
 def get_world_state() -> Dict[str, Any]:
+    global _WORLD_STATE_CACHE
+
+    now = int(time.time())
+    cached = _WORLD_STATE_CACHE
+    if cached is not None and now < cached[0]:
+        return dict(cached[1])
+
     row = fetchone(
         "SELECT weather, weather_changed_at, weather_next_change_at, updated_at FROM world_state WHERE id=1;"
     )
@@ -251,6 +299,12 @@ def get_world_state() -> Dict[str, Any]:
             "weather_next_change_at": 0,
             "updated_at": 0,
         }
+    try:
+        next_at = int(row.get("weather_next_change_at") or 0)
+    except Exception:
+        next_at = 0
+    if next_at > now:
+        _WORLD_STATE_CACHE = (min(next_at, now + _WORLD_STATE_CACHE_MAX_SEC), dict(row))
     return row
 
 
@@ -266,11 +320,22 @@ def set_world_weather(weather: str, *, changed_at: Optional[int] = None, next_ch
         """,
         (str(weather), changed, next_at, now),
     )
+    after_commit(_clear_world_state_cache)
+
+
+def _clear_world_state_cache() -> None:
+    global _WORLD_STATE_CACHE
+    _WORLD_STATE_CACHE = None
 
 
-def ensure_world_weather_rotated(*, now_ts: Optional[int] = None) -> Dict[str, Any]:
+def ensure_world_weather_rotated(
+    *, now_ts: Optional[int] = None, state: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """Return current world_state, rotating weather if it's past next_change_at.
 
+    Callers that already hold a fresh get_world_state() row can pass it as
+    `state` to skip the initial read.
+
     Design:
     - Rotation can be triggered lazily when features query the world state.
     - (Phase2) A background task may also call this to keep the world updated.
@@ -283,7 +348,8 @@ def ensure_world_weather_rotated(*, now_ts: Optional[int] = None) -> Dict[str, A
     Returns the (possibly updated) state dict.
     """
 
-    state = get_world_state()
+    if state is None:
+        state = get_world_state()
     now = int(now_ts or time.time())
 
     weather = str(state.get("weather") or "clear")
@@ -371,7 +437,13 @@ def ensure_world_weather_rotated(*, now_ts: Optional[int] = None) -> Dict[str, A
     new_weather = _roll(weather)
     new_next = _roll_next_change_at(now, new_weather)
     set_world_weather(new_weather, changed_at=now, next_change_at=new_next)
-    return get_world_state()
+    # Same row set_world_weather just wrote; no need to read it back.
+    return {
+        "weather": new_weather,
+        "weather_changed_at": now,
+        "weather_next_change_at": new_next,
+        "updated_at": int(time.time()),
+    }
 
 
 # =========================
@@ -681,7 +753,7 @@ def get_top_stamps(limit: int = 10) -> list[Dict[str, Any]]:
 # Abydos Mini-Game Economy (Phase6-2)
 # -----------------------------------------------------------------------------
 
-from decimal import Decimal, ROUND_CEILING
+from fractions import Fraction
 import datetime
 
 
@@ -748,6 +820,16 @@ def get_user_economy(user_id: int) -> Dict[str, Any]:
     return row
 
 
+def has_explored_today(user_id: int, date_ymd: str) -> bool:
+    """Cheap read-only pre-check for !탐사 (claim_daily_explore stays the real guard)."""
+
+    row = fetchone(
+        "SELECT EXISTS(SELECT 1 FROM aby_user_economy WHERE user_id=? AND last_explore_ymd=?) AS done;",
+        (int(user_id), str(date_ymd)),
+    )
+    return bool(int((row or {}).get("done") or 0))
+
+
 def claim_daily_explore(user_id: int, date_ymd: str, delta_credits: int, delta_water: int = 0) -> Optional[Dict[str, Any]]:
     """Claim one daily explore reward (KST date).
 
@@ -802,10 +884,51 @@ def claim_daily_explore(user_id: int, date_ymd: str, delta_credits: int, delta_w
 # ------------------------------
 
 
+# Short-TTL read cache for get_user_inventory (user_id -> (expires_at, inv)).
+# Commands chain several reads of the same bag within a few seconds; every
+# inventory write in this module pops the user's entry after it commits.
+#
+# Reads run in worker threads, so a reader may finish after a writer has
+# already invalidated. Each invalidation stamps the user with a fresh
+# generation; a reader only stores its snapshot if the stamp did not change
+# while it was reading. Stamps older than _INVENTORY_GEN_KEEP_SEC (far longer
+# than any read) are pruned.
+_INVENTORY_CACHE_TTL_SEC = 2.0
+_INVENTORY_CACHE_MAX = 4096
+_INVENTORY_GEN_KEEP_SEC = 60.0
+_INVENTORY_CACHE: Dict[int, Tuple[float, Dict[str, int]]] = {}
+_INVENTORY_GEN: Dict[int, Tuple[int, float]] = {}  # user_id -> (generation, stamped_at)
+_INVENTORY_GEN_SEQ = itertools.count(1)
+_INVENTORY_LOCK = threading.Lock()
+
+
+def _invalidate_inventory(user_id: int) -> None:
+    # Deferred to commit: a reader that starts before then must not be able to
+    # cache the pre-write snapshot under the new generation.
+    after_commit(functools.partial(_bump_inventory_gen, int(user_id)))
+
+
+def _bump_inventory_gen(uid: int) -> None:
+    now = time.monotonic()
+    with _INVENTORY_LOCK:
+        _INVENTORY_CACHE.pop(uid, None)
+        _INVENTORY_GEN[uid] = (next(_INVENTORY_GEN_SEQ), now)
+        if len(_INVENTORY_GEN) > _INVENTORY_CACHE_MAX:
+            for k in [k for k, (_, at) in _INVENTORY_GEN.items() if now - at > _INVENTORY_GEN_KEEP_SEC]:
+                _INVENTORY_GEN.pop(k, None)
+
+
 def get_user_inventory(user_id: int) -> Dict[str, int]:
     """Return {item_key: qty} for a user."""
 
     uid = int(user_id)
+    now = time.monotonic()
+    with _INVENTORY_LOCK:
+        hit = _INVENTORY_CACHE.get(uid)
+        gen = _INVENTORY_GEN.get(uid, (0, 0.0))[0]
+    if hit is not None and hit[0] > now:
+        return dict(hit[1])
+
     rows = fetchall(
         """
         SELECT item_key, qty
@@ -821,28 +944,50 @@ def get_user_inventory(user_id: int) -> Dict[str, int]:
         if not k:
             continue
         inv[k] = int(r.get("qty") or 0)
-    return inv
+    with _INVENTORY_LOCK:
+        # A write committed while we were reading: don't cache a stale bag.
+        if _INVENTORY_GEN.get(uid, (0, 0.0))[0] == gen:
+            if len(_INVENTORY_CACHE) >= _INVENTORY_CACHE_MAX:
+                for k in [k for k, (exp, _) in _INVENTORY_CACHE.items() if exp <= now]:
+                    _INVENTORY_CACHE.pop(k, None)
+                if len(_INVENTORY_CACHE) >= _INVENTORY_CACHE_MAX:
+                    _INVENTORY_CACHE.pop(next(iter(_INVENTORY_CACHE)), None)
+            _INVENTORY_CACHE[uid] = (now + _INVENTORY_CACHE_TTL_SEC, inv)
+    return dict(inv)
+
+
+_INVENTORY_ADD_SQL = """
+    INSERT INTO aby_inventory(user_id, item_key, qty, updated_at)
+    VALUES(?, ?, ?, ?)
+    ON CONFLICT(user_id, item_key) DO UPDATE SET
+      qty = MAX(0, qty + excluded.qty),
+      updated_at = excluded.updated_at;
+"""
 
 
-def add_user_item(user_id: int, item_key: str, qty: int = 1) -> None:
+def _inventory_add_rows(user_id: int, items: Iterable[Tuple[str, int]], now: int) -> list[tuple]:
     uid = int(user_id)
-    key = str(item_key).strip().lower()
-    q = int(qty)
-    if not key or q <= 0:
-        return
+    rows = []
+    for k, q in items:
+        key = str(k).strip().lower()
+        if key and int(q) > 0:
+            rows.append((uid, key, int(q), now))
+    return rows
 
-    now = now_ts()
+
+def add_user_item(user_id: int, item_key: str, qty: int = 1) -> None:
+    add_user_items(user_id, [(item_key, qty)])
+
+
+def add_user_items(user_id: int, items: Iterable[Tuple[str, int]]) -> None:
+    """Add several (item_key, qty) pairs in one transaction (executemany)."""
+
+    rows = _inventory_add_rows(user_id, items, now_ts())
+    if not rows:
+        return
     with transaction() as con:
-        con.execute(
-            """
-            INSERT INTO aby_inventory(user_id, item_key, qty, updated_at)
-            VALUES(?, ?, ?, ?)
-            ON CONFLICT(user_id, item_key) DO UPDATE SET
-              qty = MAX(0, qty + excluded.qty),
-              updated_at = excluded.updated_at;
-            """,
-            (uid, key, q, now),
-        )
+        con.executemany(_INVENTORY_ADD_SQL, rows)
+    _invalidate_inventory(user_id)
 
 
 def consume_user_item(user_id: int, item_key: str, qty: int = 1) -> bool:
@@ -867,6 +1012,7 @@ def consume_user_item(user_id: int, item_key: str, qty: int = 1) -> bool:
             "UPDATE aby_inventory SET qty = qty - ?, updated_at=? WHERE user_id=? AND item_key=?;",
             (q, now, uid, key),
         )
+    _invalidate_inventory(uid)
     return True
 
 
@@ -968,6 +1114,8 @@ def craft_user_items(
             (uid, -cost, (str(memo)[:200] if memo else None), now),
         )
 
+    _invalidate_inventory(uid)
+
     # re-read
     after = get_user_economy(uid)
     return {"ok": True, "credits_after": int(after.get('credits') or 0)}
@@ -1037,6 +1185,7 @@ def sell_user_item(
             (uid, earned, (str(memo)[:200] if memo else None), now),
         )
 
+    _invalidate_inventory(uid)
     after = get_user_economy(uid)
     return {
         "ok": True,
@@ -1086,20 +1235,31 @@ def clear_user_buff(user_id: int) -> None:
     )
 
 
-def ensure_user_buff_valid(user_id: int, *, now: Optional[int] = None) -> Dict[str, Any]:
+class BuffState(NamedTuple):
+    """Normalized active buff (buff_key lowercased; "" / 0 when none)."""
+
+    buff_key: str
+    stacks: int
+    expires_at: int
+
+
+_NO_BUFF = BuffState("", 0, 0)
+
+
+def ensure_user_buff_valid(user_id: int, *, now: Optional[int] = None) -> BuffState:
     """Return buff; if expired, clear it first."""
 
     ts = int(now or now_ts())
     b = get_user_buff(user_id)
     exp = int(b.get("expires_at") or 0)
-    key = str(b.get("buff_key") or "").strip()
+    key = str(b.get("buff_key") or "").strip().lower()
     stacks = int(b.get("stacks") or 0)
     if not key or stacks <= 0:
-        return {"user_id": int(user_id), "buff_key": "", "stacks": 0, "expires_at": 0, "updated_at": int(b.get("updated_at") or 0)}
+        return _NO_BUFF
     if exp > 0 and ts >= exp:
         clear_user_buff(user_id)
-        return {"user_id": int(user_id), "buff_key": "", "stacks": 0, "expires_at": 0, "updated_at": ts}
-    return b
+        return _NO_BUFF
+    return BuffState(key, stacks, exp)
 
 
 def consume_user_buff_stack(user_id: int, *, now: Optional[int] = None) -> None:
@@ -1137,13 +1297,23 @@ def ensure_guild_debt(guild_id: int, *, initial_debt: int = ABY_DEFAULT_DEBT, in
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _interest_ratio(rate: float) -> tuple[int, int]:
+    """(num, den) with num/den == 1 + rate, taking rate by its decimal repr."""
+    f = 1 + Fraction(str(rate))
+    return f.numerator, f.denominator
+
+
 def _apply_interest_once(debt: int, rate: float) -> int:
-    d = Decimal(int(debt))
-    r = Decimal(str(rate))
-    mult = Decimal("1") + r
-    new_val = (d * mult).to_integral_value(rounding=ROUND_CEILING)
+    num, den = _interest_ratio(float(rate))
+    # Exact integer ceil(debt * (1 + rate)).
+    new_val = -((-int(debt) * num) // den)
     # Never go below 0
-    return int(new_val) if new_val > 0 else 0
+    return new_val if new_val > 0 else 0
+
+
+# Public name for cogs that preview the next day's debt (same rounding).
+apply_interest_once = _apply_interest_once
 
 
 def apply_guild_interest_upto_today(guild_id: int, today_ymd: str) -> Dict[str, Any]:
@@ -1228,6 +1398,135 @@ def apply_guild_interest_upto_today(guild_id: int, today_ymd: str) -> Dict[str,
     }
 
 
+def apply_all_guild_interest_upto_today(
+    today_ymd: str,
+    *,
+    announce_channel_prefix: Optional[str] = None,
+    announce_marker_prefix: Optional[str] = None,
+) -> list[Dict[str, Any]]:
+    """Bulk version of apply_guild_interest_upto_today() for every guild.
+
+    One transaction: guilds already up to date are filtered in SQL, the rest
+    get the same per-day compounding + interest log rows. Guilds with no
+    last_interest_ymd yet are anchored to today without interest, like the
+    single-guild helper. Returns one result
+    dict (same shape as the single-guild helper) per guild that changed.
+
+    With both announce prefixes given, guilds that have an announce channel
+    configured (`<announce_channel_prefix><gid>`) and were not announced today
+    also get `<announce_marker_prefix><gid>` set to today in the same
+    transaction; their result carries `announce_channel_id` (0 otherwise).
+    """
+
+    today = str(today_ymd)
+    now = now_ts()
+    out: list[Dict[str, Any]] = []
+    markers: list[tuple] = []
+    # Most guilds share the same last_interest_ymd; parse/iterate each span once.
+    day_spans: Dict[str, list[str]] = {}
+    with_announce = bool(announce_channel_prefix and announce_marker_prefix)
+
+    with transaction() as con:
+        if with_announce:
+            rows = con.execute(
+                """
+                SELECT d.guild_id, d.debt, d.interest_rate, d.last_interest_ymd,
+                       COALESCE(ch.value, ''), COALESCE(mk.value, '')
+                FROM aby_guild_debt d
+                LEFT JOIN bot_config ch ON ch.key = ? || d.guild_id
+                LEFT JOIN bot_config mk ON mk.key = ? || d.guild_id
+                WHERE COALESCE(d.last_interest_ymd, '') < ?;
+                """,
+                (str(announce_channel_prefix), str(announce_marker_prefix), today),
+            ).fetchall()
+        else:
+            rows = con.execute(
+                """
+                SELECT guild_id, debt, interest_rate, last_interest_ymd, '', ''
+                FROM aby_guild_debt
+                WHERE COALESCE(last_interest_ymd, '') < ?;
+                """,
+                (today,),
+            ).fetchall()
+
+        logs: list[tuple] = []
+        updates: list[tuple] = []
+        for r in rows:
+            gid = int(r[0])
+            debt = int(r[1])
+            rate = float(r[2])
+            if rate > 0.05:  # legacy percent scale (see apply_guild_interest_upto_today)
+                rate = rate / 100.0
+            old_debt = debt
+            applied_days = 0
+            # Never-anchored rows ('' or NULL) start counting today, no interest charged.
+            start = str(r[3] or "") or today
+            span = day_spans.get(start)
+            if span is None:
+                span = day_spans[start] = list(_ymd_iter_exclusive(start, today))
+            for ymd in span:
+                new_debt = _apply_interest_once(debt, rate)
+                logs.append((gid, int(new_debt - debt), ymd, now))
+                debt = new_debt
+                applied_days += 1
+
+            updates.append((debt, rate, today, now, gid))
+
+            announce_channel_id = 0
+            if with_announce and applied_days > 0 and str(r[5]) != today:
+                try:
+                    announce_channel_id = int(str(r[4]) or 0)
+                except Exception:
+                    announce_channel_id = 0
+                if announce_channel_id:
+                    markers.append((f"{announce_marker_prefix}{gid}", today, now))
+
+            out.append(
+                {
+                    "guild_id": gid,
+                    "debt": debt,
+                    "interest_rate": rate,
+                    "last_interest_ymd": today,
+                    "applied_days": applied_days,
+                    "old_debt": old_debt,
+                    "announce_channel_id": announce_channel_id,
+                }
+            )
+
+        if logs:
+            con.executemany(
+                """
+                INSERT INTO aby_economy_log(guild_id, user_id, kind, delta_credits, delta_water, delta_debt, memo, created_at)
+                VALUES(?, NULL, 'interest', 0, 0, ?, ?, ?);
+                """,
+                logs,
+            )
+        if updates:
+            con.executemany(
+                """
+                UPDATE aby_guild_debt
+                SET debt=?, interest_rate=?, last_interest_ymd=?, updated_at=?
+                WHERE guild_id=?;
+                """,
+                updates,
+            )
+        if markers:
+            con.executemany(
+                """
+                INSERT INTO bot_config(key, value, updated_at)
+                VALUES(?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at;
+                """,
+                markers,
+            )
+
+    # Only after commit: keep the get_config() cache in sync with the markers.
+    for key, value, _ in markers:
+        after_commit(functools.partial(_CONFIG_CACHE.__setitem__, key, value))
+
+    return [r for r in out if r["applied_days"] > 0]
+
+
 def get_guild_debt(guild_id: int, today_ymd: Optional[str] = None) -> Dict[str, Any]:
     gid = int(guild_id)
     if today_ymd is not None:
@@ -1255,13 +1554,17 @@ def get_guild_debt(guild_id: int, today_ymd: Optional[str] = None) -> Dict[str,
 def repay_guild_debt(guild_id: int, user_id: int, amount: int, today_ymd: str) -> Dict[str, Any]:
     """Repay part of the guild debt from user's credits.
 
+    amount=-1 means "all-in": pay every credit the user has, decided inside
+    the same transaction as the debit (no separate balance read needed).
+
     Returns a result dict with status.
     """
 
     gid = int(guild_id)
     uid = int(user_id)
     amt = int(amount)
-    if amt <= 0:
+    all_in = amt == -1
+    if amt <= 0 and not all_in:
         return {"ok": False, "reason": "amount"}
 
     # Apply interest first so the story feels relentless.
@@ -1278,7 +1581,7 @@ def repay_guild_debt(guild_id: int, user_id: int, amount: int, today_ymd: str) -
         if credits <= 0:
             return {"ok": False, "reason": "no_credits", "credits": credits}
 
-        pay = min(amt, credits)
+        pay = credits if all_in else min(amt, credits)
 
         g = con.execute(
             "SELECT debt, interest_rate, last_interest_ymd FROM aby_guild_debt WHERE guild_id=?;",
@@ -1317,6 +1620,7 @@ def repay_guild_debt(guild_id: int, user_id: int, amount: int, today_ymd: str) -
         "paid": pay,
         "old_debt": debt,
         "new_debt": new_debt,
+        "credits_before": credits,
         "credits_after": max(0, credits - pay),
     }
 
@@ -1455,6 +1759,7 @@ ABY_DAILY_QUEST_COUNT = 3
 ABY_WEEKLY_QUEST_COUNT = 3
 
 
+@functools.lru_cache(maxsize=64)
 def week_key_from_ymd(ymd: str) -> str:
     """Return ISO week key like '2025W53' for a given KST ymd."""
 
@@ -1533,6 +1838,49 @@ def upsert_explore_meta(
     )
 
 
+def apply_explore_result(
+    user_id: int,
+    date_ymd: str,
+    delta_credits: int,
+    delta_water: int = 0,
+    *,
+    weather: str,
+    success: bool,
+    items: Sequence[Tuple[str, int]] = (),
+    consume_buff: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """One-transaction version of the !탐사 write path.
+
+    claim_daily_explore + upsert_explore_meta + add_user_items
+    + consume_user_buff_stack, all committed together.
+
+    Returns the updated economy row, or None if already claimed today
+    (in which case nothing is written).
+    """
+
+    uid = int(user_id)
+    ymd = str(date_ymd)
+
+    # Nested helper transactions run as savepoints on this one connection.
+    with transaction():
+        econ = claim_daily_explore(uid, ymd, delta_credits, delta_water)
+        if econ is None:
+            return None
+        upsert_explore_meta(
+            uid,
+            ymd,
+            weather=weather,
+            success=success,
+            credits_delta=int(delta_credits),
+            water_delta=max(0, int(delta_water)),
+        )
+        add_user_items(uid, items)
+        if consume_buff:
+            consume_user_buff_stack(uid)
+
+    return econ
+
+
 def get_explore_meta(user_id: int, date_ymd: str) -> Optional[Dict[str, Any]]:
     return fetchone(
         """
@@ -1782,6 +2130,12 @@ def _insert_quests(guild_id: int, scope: str, board_key: str, quests: list[dict]
                     now,
                 ),
             )
+    after_commit(functools.partial(_drop_quest_board_cache, (gid, sc, bk)))
+
+
+def _drop_quest_board_cache(key: Tuple[int, str, str]) -> None:
+    with _QUEST_BOARD_LOCK:
+        _QUEST_BOARD_CACHE.pop(key, None)
 
 
 def ensure_aby_daily_quest_board(guild_id: int, today_ymd: str) -> None:
@@ -1821,22 +2175,97 @@ def ensure_aby_weekly_quest_board(guild_id: int, week_key: str) -> None:
     _insert_quests(int(guild_id), "weekly", str(week_key), quests)
 
 
-def get_aby_quests(guild_id: int, scope: str, board_key: str) -> list[Dict[str, Any]]:
+class AbyQuest(NamedTuple):
+    """One quest-board row with native types (str fields "" / int fields 0 when NULL)."""
+
+    quest_no: int
+    quest_type: str
+    title: str
+    description: str
+    target_key: str
+    target_qty: int
+    reward_points: int
+    reward_credits: int
+    reward_item_key: str
+    reward_item_qty: int
+
+
+# Board definitions never change once a period's board is complete, so they
+# are cached until the board's period ends (next KST midnight / next Monday).
+# (guild_id, scope, board_key) -> (expires_at unix ts, rows)
+# Readers run in worker threads (asyncio.to_thread), so every access holds the lock.
+_QUEST_BOARD_CACHE: Dict[Tuple[int, str, str], Tuple[float, list[AbyQuest]]] = {}
+_QUEST_BOARD_CACHE_MAX = 512
+_QUEST_BOARD_LOCK = threading.Lock()
+
+
+def _quest_board_expires_at(scope: str, board_key: str) -> float:
+    if scope == "weekly":
+        parsed = _parse_week_key(board_key)
+        if not parsed:
+            return 0.0
+        try:
+            end = datetime.date.fromisocalendar(parsed[0], parsed[1], 1) + datetime.timedelta(days=7)
+        except Exception:
+            return 0.0
+    else:
+        try:
+            end = datetime.date.fromisoformat(board_key) + datetime.timedelta(days=1)
+        except Exception:
+            return 0.0
+    return datetime.datetime(end.year, end.month, end.day, tzinfo=KST).timestamp()
+
+
+def get_aby_quests(guild_id: int, scope: str, board_key: str) -> list[AbyQuest]:
+    key = (int(guild_id), str(scope), str(board_key))
+    now = time.time()
+    with _QUEST_BOARD_LOCK:
+        hit = _QUEST_BOARD_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return list(hit[1])
+
     rows = fetchall(
         """
-        SELECT guild_id, scope, board_key, quest_no, quest_type, title, description,
+        SELECT quest_no, quest_type, title, description,
                COALESCE(target_key, '') AS target_key, target_qty,
                reward_points, reward_credits,
                COALESCE(reward_item_key, '') AS reward_item_key,
-               reward_item_qty,
-               created_at
+               reward_item_qty
         FROM aby_quest_board
         WHERE guild_id=? AND scope=? AND board_key=?
         ORDER BY quest_no ASC;
         """,
-        (int(guild_id), str(scope), str(board_key)),
-    )
-    return rows or []
+        key,
+    )
+    quests = [
+        AbyQuest(
+            int(r.get("quest_no") or 0),
+            str(r.get("quest_type") or ""),
+            str(r.get("title") or ""),
+            str(r.get("description") or ""),
+            str(r.get("target_key") or ""),
+            int(r.get("target_qty") or 0),
+            int(r.get("reward_points") or 0),
+            int(r.get("reward_credits") or 0),
+            str(r.get("reward_item_key") or ""),
+            int(r.get("reward_item_qty") or 0),
+        )
+        for r in (rows or [])
+    ]
+
+    # Only cache complete boards; a partially generated one is re-read.
+    full = ABY_WEEKLY_QUEST_COUNT if key[1] == "weekly" else ABY_DAILY_QUEST_COUNT
+    expires_at = _quest_board_expires_at(key[1], key[2])
+    if len(quests) >= full and expires_at > now:
+        with _QUEST_BOARD_LOCK:
+            if len(_QUEST_BOARD_CACHE) >= _QUEST_BOARD_CACHE_MAX:
+                for k in [k for k, (exp, _) in _QUEST_BOARD_CACHE.items() if exp <= now]:
+                    _QUEST_BOARD_CACHE.pop(k, None)
+                # Still full of live boards: drop the oldest insert.
+                if len(_QUEST_BOARD_CACHE) >= _QUEST_BOARD_CACHE_MAX:
+                    _QUEST_BOARD_CACHE.pop(next(iter(_QUEST_BOARD_CACHE)), None)
+            _QUEST_BOARD_CACHE[key] = (expires_at, quests)
+    return list(quests)
 
 
 def get_aby_quest(guild_id: int, scope: str, board_key: str, quest_no: int) -> Optional[Dict[str, Any]]:
@@ -1867,6 +2296,19 @@ def is_aby_quest_claimed(guild_id: int, scope: str, board_key: str, quest_no: in
     return bool(row)
 
 
+def get_aby_quests_claim_map(guild_id: int, scope: str, board_key: str, user_id: int) -> set[int]:
+    """Return quest_no values the user already claimed on one board (one query)."""
+    rows = fetchall(
+        """
+        SELECT quest_no
+        FROM aby_quest_claims
+        WHERE guild_id=? AND scope=? AND board_key=? AND user_id=?;
+        """,
+        (int(guild_id), str(scope), str(board_key), int(user_id)),
+    )
+    return {int(r.get("quest_no") or 0) for r in (rows or [])}
+
+
 def get_user_weekly_points(guild_id: int, week_key: str, user_id: int) -> int:
     row = fetchone(
         """
@@ -1947,6 +2389,29 @@ def repay_total_for_week(guild_id: int, user_id: int, week_key: str) -> int:
     return _repay_total_for_ymds(guild_id, user_id, ymds)
 
 
+def get_repay_totals(guild_id: int, user_id: int, today_ymd: str, week_key: str) -> Tuple[int, int]:
+    """Return (today_total, week_total) repaid by the user in one query."""
+    day = str(today_ymd)
+    week = [str(x) for x in week_ymds_from_week_key(week_key) if str(x)]
+    days = list(dict.fromkeys([day, *week]))
+    ph_all = ",".join(["?"] * len(days))
+    if week:
+        week_expr = f"CASE WHEN memo IN ({','.join(['?'] * len(week))}) THEN -delta_credits ELSE 0 END"
+    else:
+        week_expr = "0"
+    row = fetchone(
+        f"""
+        SELECT
+          COALESCE(SUM(CASE WHEN memo=? THEN -delta_credits ELSE 0 END), 0) AS day_total,
+          COALESCE(SUM({week_expr}), 0) AS week_total
+        FROM aby_economy_log
+        WHERE guild_id=? AND user_id=? AND kind='repay' AND memo IN ({ph_all});
+        """,
+        (day, *week, int(guild_id), int(user_id), *days),
+    )
+    return int((row or {}).get("day_total") or 0), int((row or {}).get("week_total") or 0)
+
+
 def _has_sandstorm_success_in_week(user_id: int, week_key: str) -> bool:
     uid = int(user_id)
     ymds = week_ymds_from_week_key(week_key)
@@ -2139,6 +2604,7 @@ def claim_aby_quest(
                 ),
             )
 
+    _invalidate_inventory(uid)
     return {
         "ok": True,
         "reward_points": reward_points,
@@ -2234,6 +2700,31 @@ def update_aby_incident_state(
         (gid, int(next_incident_at), last, now),
     )
 
+
+def bulk_incident_tick_state(*, notice_key_prefix: str = "aby_notice_channel_id:") -> Dict[int, Dict[str, Any]]:
+    """One-query snapshot for the incident loop: {guild_id: row}.
+
+    Covers every guild with a debt row. Each row carries debt,
+    next/last_incident_at (None if no scheduler row yet) and the raw
+    notice-channel config value (None if unset).
+    """
+
+    rows = fetchall(
+        """
+        SELECT d.guild_id, d.debt,
+               s.next_incident_at, s.last_incident_at,
+               c.value AS notice_channel
+        FROM aby_guild_debt d
+        LEFT JOIN aby_incident_state s ON s.guild_id = d.guild_id
+        LEFT JOIN bot_config c ON c.key = ? || d.guild_id
+        WHERE d.guild_id > 0
+        ORDER BY d.guild_id ASC;
+        """,
+        (str(notice_key_prefix),),
+    )
+    return {int(r["guild_id"]): r for r in rows or []}
+
+
 def add_aby_incident_log(guild_id: int, *, kind: str, title: str, description: str, delta_debt: int) -> None:
     gid = int(guild_id)
     k = str(kind or "incident")[:40]
@@ -2394,6 +2885,35 @@ def get_weekly_debt_summary(guild_id: int, week_key: str) -> Dict[str, Any]:
     }
 
 
+def get_weekly_report_bundle(
+    guild_id: int,
+    week_key: str,
+    *,
+    today_ymd: Optional[str] = None,
+    limit: int = 5,
+) -> Dict[str, Any]:
+    """Everything the weekly report needs, read on one connection.
+
+    Returns {"summary", "debt", "tops", "points"}; the reads share a single
+    deferred (read-only) transaction so the report sees one consistent
+    snapshot without holding the write lock.
+    """
+
+    gid = int(guild_id)
+    wk = str(week_key)
+    # The interest catch-up is the only write; it runs first in its own
+    # IMMEDIATE transaction so the snapshot below never needs a lock upgrade.
+    if today_ymd is not None:
+        apply_guild_interest_upto_today(gid, today_ymd)
+    with transaction(immediate=False):
+        return {
+            "summary": get_weekly_debt_summary(gid, wk),
+            "debt": get_guild_debt(gid),
+            "tops": top_repay_users_for_week(gid, wk, limit=limit),
+            "points": get_weekly_points_ranking(gid, wk, limit=limit),
+        }
+
+
 # =========================
 # Abydos Web Sync helpers
 # =========================
@@ -22,6 +22,8 @@ HTTP Contract (suggestion)
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
 import time
@@ -45,6 +47,44 @@ from yume_store import (
 )
 
 logger = logging.getLogger(__name__)
+
+# The snapshot can carry thousands of rows; use orjson when it's installed.
+try:
+    import orjson  # type: ignore
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# One pooled session per process: every sync POSTs to the same host, so
+# keep-alive connections save a TCP+TLS handshake per tick.
+_HTTP_SESSION: aiohttp.ClientSession | None = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=8),
+            headers={"User-Agent": "yume-bot/aby-sync"},
+        )
+    return _HTTP_SESSION
+
+
+async def close_http_session() -> None:
+    """Close the pooled HTTP session (safe to call multiple times)."""
+
+    global _HTTP_SESSION
+    sess, _HTTP_SESSION = _HTTP_SESSION, None
+    if sess is not None and not sess.closed:
+        await sess.close()
+
+
 def _row_to_dict(row):
     """sqlite3.Row / dict / None 을 안전하게 dict로 정규화한다.
     - sqlite3.Row: .get 이 없어서 dict로 변환해준다.
@@ -81,7 +121,11 @@ def _today_ymd_kst() -> str:
     return datetime.now(tz=KST).date().isoformat()
 
 
+@functools.lru_cache(maxsize=1)
 def _read_env() -> tuple[str | None, str | None]:
+    # NOTE: env is read once per process (the sync loop asks every tick).
+    # Changing the URL/token requires a restart.
+    #
     # NOTE: 서버/봇 사이에 env 이름이 섞이는 일이 많아서(구버전 호환),
     # 여러 키를 폭넓게 허용한다.
     url = (
@@ -129,6 +173,7 @@ def _read_env() -> tuple[str | None, str | None]:
 
     return (url or None, token or None)
 
+
 def get_sync_config() -> tuple[str | None, str | None]:
     """Return normalized (url, token) for Abydos web sync."""
     return _read_env()
@@ -328,26 +373,23 @@ async def post_sync_payload(bot: discord.Client) -> bool:
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-        "User-Agent": "yume-bot/aby-sync",
     }
 
-    timeout = aiohttp.ClientTimeout(total=8)
-
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=payload, headers=headers) as resp:
-                if 200 <= resp.status < 300:
-                    return True
-
-                # Try to read response text (limited) for debug.
-                try:
-                    txt = await resp.text()
-                    txt = (txt or "")[:300]
-                except Exception:
-                    txt = ""
-
-                logger.warning("[websync] non-2xx: %s %s", resp.status, txt)
-                return False
+        session = _get_http_session()
+        async with session.post(url, data=_dumps_bytes(payload), headers=headers) as resp:
+            if 200 <= resp.status < 300:
+                return True
+
+            # Try to read response text (limited) for debug.
+            try:
+                txt = await resp.text()
+                txt = (txt or "")[:300]
+            except Exception:
+                txt = ""
+
+            logger.warning("[websync] non-2xx: %s %s", resp.status, txt)
+            return False
 
     except Exception as e:
         logger.warning("[websync] post failed: %s", e)